@@ -1,11 +1,13 @@
 # core/database.py
 import sqlite3
-import os
 from typing import List, Optional
 from .models import Track
 
 DB_FILE = "music_library.db"
 
+# Bump whenever initialize_db() changes; stored in the file as PRAGMA user_version
+SCHEMA_VERSION = 1
+
 def get_db_connection():
     """Establishes a connection to the SQLite database."""
     conn = sqlite3.connect(DB_FILE)
@@ -14,14 +16,15 @@ def get_db_connection():
     return conn
 
 def initialize_db():
-    """Creates the database tables if they don't exist."""
-    if os.path.exists(DB_FILE):
-        return # Assume already initialized if file exists
-
-    print("Initializing database...")
+    """Creates the database tables unless the file is already on SCHEMA_VERSION."""
     conn = get_db_connection()
     cursor = conn.cursor()
     try:
+        # One PRAGMA read replaces the DDL on every start after the first
+        if cursor.execute("PRAGMA user_version").fetchone()[0] >= SCHEMA_VERSION:
+            return
+
+        print("Initializing database...")
         cursor.execute('''
             CREATE TABLE IF NOT EXISTS tracks (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -39,7 +42,28 @@ def initialize_db():
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_artist ON tracks (artist);")
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_album ON tracks (album);")
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_filepath ON tracks (filepath);")
-        # Add playlists table later if needed
+
+        # Create playlists table
+        cursor.execute("""
+        CREATE TABLE IF NOT EXISTS playlists (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            name TEXT UNIQUE NOT NULL
+        )
+        """)
+
+        # Create playlist_tracks table for playlist-track associations
+        cursor.execute("""
+        CREATE TABLE IF NOT EXISTS playlist_tracks (
+            playlist_id INTEGER,
+            track_id INTEGER,
+            position INTEGER,
+            PRIMARY KEY (playlist_id, track_id),
+            FOREIGN KEY (playlist_id) REFERENCES playlists (id) ON DELETE CASCADE,
+            FOREIGN KEY (track_id) REFERENCES tracks (id) ON DELETE CASCADE
+        )
+        """)
+
+        cursor.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
         conn.commit()
         print("Database initialized.")
     except sqlite3.Error as e:
@@ -49,47 +73,7 @@ def initialize_db():
 
 def create_tables():
     """Create required database tables if they don't exist."""
-    conn = get_db_connection()
-    cursor = conn.cursor()
-    
-    # Create tracks table
-    cursor.execute("""
-    CREATE TABLE IF NOT EXISTS tracks (
-        id INTEGER PRIMARY KEY AUTOINCREMENT,
-        filepath TEXT UNIQUE NOT NULL,
-        title TEXT,
-        artist TEXT,
-        album TEXT,
-        track_number INTEGER,
-        duration REAL,
-        year INTEGER,
-        genre TEXT,
-        album_art BLOB
-    )
-    """)
-    
-    # Create playlists table
-    cursor.execute("""
-    CREATE TABLE IF NOT EXISTS playlists (
-        id INTEGER PRIMARY KEY AUTOINCREMENT,
-        name TEXT UNIQUE NOT NULL
-    )
-    """)
-    
-    # Create playlist_tracks table for playlist-track associations
-    cursor.execute("""
-    CREATE TABLE IF NOT EXISTS playlist_tracks (
-        playlist_id INTEGER,
-        track_id INTEGER,
-        position INTEGER,
-        PRIMARY KEY (playlist_id, track_id),
-        FOREIGN KEY (playlist_id) REFERENCES playlists (id) ON DELETE CASCADE,
-        FOREIGN KEY (track_id) REFERENCES tracks (id) ON DELETE CASCADE
-    )
-    """)
-    
-    conn.commit()
-    conn.close()
+    initialize_db()
 
 def add_or_update_track(track):
     """Adds a new track or updates existing based on filepath."""
@@ -106,21 +90,22 @@ def add_or_update_track(track):
             track_id = result[0]
             cursor.execute('''
                 UPDATE tracks SET
-                title = ?, artist = ?, album = ?, genre = ?, duration = ?, album_art = ?
+                title = ?, artist = ?, album = ?, genre = ?, duration = ?, album_art = ?,
+                track_number = ?, year = ?
                 WHERE id = ?
             ''', (
                 track.title, track.artist, track.album, track.genre,
-                track.length, track.album_art, track_id
+                track.length, track.album_art, track.track_number, track.year, track_id
             ))
         else:
             # Insert new track
             cursor.execute('''
                 INSERT INTO tracks
-                (filepath, title, artist, album, genre, duration, album_art)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
+                (filepath, title, artist, album, genre, duration, album_art, track_number, year)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
             ''', (
                 track.filepath, track.title, track.artist, track.album,
-                track.genre, track.length, track.album_art
+                track.genre, track.length, track.album_art, track.track_number, track.year
             ))
             track_id = cursor.lastrowid
         
@@ -5,7 +5,14 @@ from typing import Optional
 class Track:
     """Represents a single music track."""
     
-    def __init__(self, id=None, filepath="", title="", artist="", album="", genre="", length=0, album_art=None):
+    # Fixed attribute set keeps instances small when the scanner holds many of them
+    __slots__ = (
+        'id', 'filepath', 'title', 'artist', 'album', 'genre', 'length',
+        'album_art', 'track_number', 'year', 'duration'
+    )
+    
+    def __init__(self, id=None, filepath="", title="", artist="", album="", genre="", length=0, album_art=None,
+                 track_number=None, year=None, duration=None):
         self.id = id
         self.filepath = filepath
         self.title = title if title else self._extract_title_from_path(filepath)
@@ -14,6 +21,9 @@ class Track:
         self.genre = genre if genre else ""
         self.length = length
         self.album_art = album_art
+        self.track_number = track_number
+        self.year = year
+        self.duration = duration
         
     def _extract_title_from_path(self, filepath):
         """Extract a title from the filepath if possible."""
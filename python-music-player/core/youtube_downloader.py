@@ -4,17 +4,396 @@
 import os
 import re
 import sys
-import uuid
+import json
+import hashlib
+import functools
 import tempfile
 import subprocess
-from typing import Optional, Tuple, Dict
-from PySide6.QtCore import QObject, Signal, QRunnable, Slot
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from dataclasses import dataclass
+from typing import Optional, Tuple, Dict, List
+from PySide6.QtCore import QObject, Signal, QRunnable, QThreadPool, Slot
 import platform
 import zipfile
+import tarfile
 import shutil
-from urllib.request import urlretrieve
+from urllib.request import urlopen, Request
 import time
 import traceback
+import unicodedata
+
+try:
+    import requests
+except ImportError:
+    requests = None
+
+# Directory next to the app where we keep downloaded yt-dlp/FFmpeg binaries
+_BIN_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "bin")
+
+# yt-dlp and FFmpeg are launched by absolute path with close_fds=False, which
+# lets CPython use posix_spawn instead of fork+exec. The pipes subprocess
+# creates are non-inheritable, so nothing extra leaks into the child.
+_SPAWN_KWARGS = {"close_fds": False}
+
+# Resolved playlist listings are kept on disk for a day so re-queuing the same
+# playlist skips the yt-dlp extraction round trip
+_META_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".ytune", "meta")
+_META_CACHE_TTL = 24 * 60 * 60  # seconds
+
+# Lightweight YouTube client and no format probing: audio-only jobs don't need
+# the full DASH manifest or a HEAD check of every format yt-dlp lists
+_FAST_EXTRACTOR_ARGS = (
+    "--extractor-args", "youtube:player_client=web_safari;player_skip=configs",
+    "--no-check-formats",
+)
+
+# FFmpeg output settings for _convert_to_mp3, the fallback-strategy converter
+_MP3_ENCODE_ARGS = (
+    '-vn',  # No video
+    '-ar', '44100',  # Audio sampling rate
+    '-ac', '2',  # Stereo
+    '-b:a', '192k',  # Bitrate
+    '-f', 'mp3',  # Format
+)
+
+# Used where we encode instead of yt-dlp, to match its --audio-quality 0:
+# LAME VBR V0 at the source sample rate
+_MP3_VBR_ENCODE_ARGS = (
+    '-vn',  # No video
+    '-c:a', 'libmp3lame',
+    '-q:a', '0',  # Highest VBR quality
+    '-f', 'mp3',  # Format
+)
+
+# Pinned yt-dlp cache so the player JS / signature data survives across jobs
+_YTDLP_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".ytune", "ytdlp-cache")
+
+_YT_URL_RE = re.compile(r'(https?://)?(www\.)?(youtube|youtu|youtube-nocookie)\.(com|be)/')
+# Characters not allowed in Windows file names, stripped with str.translate
+_SANITIZE_TABLE = str.maketrans('', '', '\\/*?:"<>|')
+# What yt-dlp's --restrict-filenames keeps; any other run becomes one "_"
+_RESTRICTED_RUN_RE = re.compile(r'[^A-Za-z0-9_.-]+')
+_DASH_RE = re.compile(r'^(.*?)\s*[-–—:]\s*(.*?)$')
+_BY_RE = re.compile(r'(.*)\s+by\s+(.*)', re.IGNORECASE)
+
+# yt-dlp output lines parsed while a download runs, as one alternation so a batch
+# of lines is scanned once; match.lastgroup tells which kind of line it was
+_YTDLP_LINE_RE = re.compile(
+    r'\[download\] Destination: (?P<dest>.+)'
+    r'|Downloading (?P<count>\d+) videos'
+    r'|\[download\] Downloading video (?P<index>\d+) of (?P<total>\d+)'
+    r'|\[download\]\s+(?P<pct>\d+\.\d+)%'
+    r'|\[ffmpeg\] Destination: (?P<ffdest>.+)'
+    r'|(?P<deleted>Deleting original file)'
+)
+
+
+# Buffer size for streaming binary downloads to disk
+_DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+# Read size for yt-dlp's stdout/stderr pipes
+_PIPE_CHUNK_SIZE = 64 * 1024
+
+
+@functools.lru_cache(maxsize=1)
+def _http_session():
+    """Shared keep-alive session so fallback URLs reuse the open connection."""
+    session = requests.Session()
+    session.headers["User-Agent"] = "YTune"
+    return session
+
+
+def _fetch(url: str, dest: str, chunk_size: int = _DOWNLOAD_CHUNK_SIZE):
+    """
+    Stream a URL to a file in chunks (64 KiB unless told otherwise)
+    
+    The body goes to `dest + ".part"` and only replaces `dest` once the whole
+    response has arrived, so an HTTP error or dropped connection never leaves
+    a truncated file at `dest`.
+    """
+    part_path = dest + ".part"
+    try:
+        if requests is not None:
+            with _http_session().get(url, stream=True, timeout=60) as response:
+                response.raise_for_status()
+                with open(part_path, "wb", buffering=chunk_size) as f:
+                    for chunk in response.iter_content(chunk_size):
+                        f.write(chunk)
+        else:
+            # Binaries are already compressed; ask for them as-is
+            request = Request(url, headers={"Accept-Encoding": "identity"})
+            with urlopen(request, timeout=60) as response:
+                if not 200 <= response.status < 300:
+                    raise OSError(f"HTTP {response.status} fetching {url}")
+                with open(part_path, "wb", buffering=chunk_size) as f:
+                    shutil.copyfileobj(response, f, length=chunk_size)
+        os.replace(part_path, dest)
+    except BaseException:
+        try:
+            os.remove(part_path)
+        except OSError:
+            pass
+        raise
+
+
+def _restrict_filename(name: str) -> str:
+    """Reduce a title to the ASCII-only names yt-dlp's --restrict-filenames produces."""
+    name = unicodedata.normalize('NFKD', name).encode('ascii', 'ignore').decode('ascii')
+    return _RESTRICTED_RUN_RE.sub('_', name).strip('_-.')
+
+
+def _unique_path(path: str) -> str:
+    """Return path, or path with a _N suffix if a file by that name already exists."""
+    root, ext = os.path.splitext(path)
+    n = 1
+    while os.path.exists(path):
+        path = f"{root}_{n}{ext}"
+        n += 1
+    return path
+
+
+def _newest_recent_file(directory: str, since: float, suffix: str = "") -> Optional[str]:
+    """Return the newest file in a directory modified after `since`, if any."""
+    newest_path, newest_mtime = None, since
+    try:
+        with os.scandir(directory) as it:
+            for entry in it:
+                if not entry.name.endswith(suffix) or not entry.is_file():
+                    continue
+                mtime = entry.stat().st_mtime
+                if mtime > newest_mtime:
+                    newest_path, newest_mtime = entry.path, mtime
+    except OSError:
+        return None
+    return newest_path
+
+
+# FFmpeg builds per (system, machine), in order of preference
+_FFMPEG_MIRRORS = {
+    ("windows", "x86_64"): [
+        "https://github.com/BtbN/FFmpeg-Builds/releases/download/latest/ffmpeg-master-latest-win64-gpl.zip",
+        "https://www.gyan.dev/ffmpeg/builds/ffmpeg-release-essentials.zip",
+    ],
+    # evermeet only publishes Intel builds; Apple Silicon runs them under Rosetta
+    ("darwin", "x86_64"): ["https://evermeet.cx/ffmpeg/getrelease/ffmpeg/zip"],
+    ("darwin", "aarch64"): ["https://evermeet.cx/ffmpeg/getrelease/ffmpeg/zip"],
+    ("linux", "x86_64"): ["https://johnvansickle.com/ffmpeg/releases/ffmpeg-release-amd64-static.tar.xz"],
+    ("linux", "aarch64"): ["https://johnvansickle.com/ffmpeg/releases/ffmpeg-release-arm64-static.tar.xz"],
+}
+
+# platform.machine() spellings that name the same architecture
+_MACHINE_ALIASES = {"amd64": "x86_64", "x64": "x86_64", "arm64": "aarch64"}
+
+# Held while FFmpeg is fetched into _BIN_DIR so parallel jobs download it once
+_FFMPEG_INSTALL_LOCK = threading.Lock()
+
+
+def _probe(url: str) -> bool:
+    """Return True if a HEAD request for the URL succeeds."""
+    try:
+        if requests is not None:
+            response = _http_session().head(url, allow_redirects=True, timeout=10)
+            return response.ok
+        with urlopen(Request(url, method="HEAD"), timeout=10) as response:
+            return response.status < 400
+    except Exception:
+        return False
+
+
+def _rank_mirrors(urls):
+    """Probe all mirrors at once; reachable ones come first, fastest first."""
+    if len(urls) < 2:
+        return list(urls)
+    
+    reachable = []
+    with ThreadPoolExecutor(max_workers=len(urls)) as pool:
+        futures = {pool.submit(_probe, url): url for url in urls}
+        pending = set(futures)
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            reachable.extend(futures[f] for f in done if f.result())
+    
+    # Keep unreachable mirrors as a last resort in case HEAD is not supported
+    return reachable + [url for url in urls if url not in reachable]
+
+
+def _extract_zip_member(zip_path: str, name: str, dest_dir: str) -> Optional[str]:
+    """Extract only the first member whose file name is `name` from a zip archive."""
+    with zipfile.ZipFile(zip_path, 'r') as zip_ref:
+        for member in zip_ref.namelist():
+            if member.rsplit('/', 1)[-1] == name:
+                return zip_ref.extract(member, dest_dir)
+    return None
+
+
+def _stream_tar_member(url: str, name: str, dest_dir: str) -> Optional[str]:
+    """Stream a .tar.xz from a URL and write out only the member called `name`.
+    
+    The archive is decompressed as it arrives, so it never lands on disk and
+    none of the other members are written.
+    """
+    if requests is not None:
+        response = _http_session().get(url, stream=True, timeout=60)
+        try:
+            response.raise_for_status()
+        except BaseException:
+            response.close()
+            raise
+        response.raw.decode_content = True
+        source = response.raw
+    else:
+        response = urlopen(url, timeout=60)
+        source = response
+    
+    with response, tarfile.open(fileobj=source, mode="r|xz") as tar:
+        for member in tar:
+            if member.isfile() and member.name.rsplit('/', 1)[-1] == name:
+                dest = os.path.join(dest_dir, name)
+                with tar.extractfile(member) as fsrc, open(dest, "wb") as fdst:
+                    shutil.copyfileobj(fsrc, fdst, length=_DOWNLOAD_CHUNK_SIZE)
+                return dest
+    return None
+
+
+def _install_binary(src: str, dst: str, executable: bool = False):
+    """Copy a binary into place with a 1 MiB buffer, then atomically swap it in."""
+    tmp_path = f"{dst}.tmp"
+    try:
+        with open(src, "rb") as fsrc, open(tmp_path, "wb") as fdst:
+            shutil.copyfileobj(fsrc, fdst, length=1 << 20)
+        if executable:
+            os.chmod(tmp_path, 0o755)
+        os.replace(tmp_path, dst)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def _meta_cache_path(url: str) -> str:
+    """Return the cache file used for a URL's resolved metadata."""
+    key = hashlib.sha1(url.encode('utf-8')).hexdigest()
+    return os.path.join(_META_CACHE_DIR, f"{key}.json")
+
+
+def _load_cached_meta(url: str) -> Optional[Dict]:
+    """Return cached metadata for a URL, or None if missing or expired."""
+    path = _meta_cache_path(url)
+    try:
+        if time.time() - os.path.getmtime(path) > _META_CACHE_TTL:
+            return None
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _store_cached_meta(url: str, meta: Dict):
+    """Persist metadata for a URL; failures only cost a cache miss later."""
+    path = _meta_cache_path(url)
+    try:
+        os.makedirs(_META_CACHE_DIR, exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(meta, f)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        print(f"Could not write metadata cache for {url}: {e}")
+
+
+@functools.lru_cache(maxsize=1)
+def _discover_ytdlp() -> Optional[Tuple[Tuple[str, ...], str]]:
+    """
+    Look for an installed yt-dlp/youtube-dl executable
+    
+    The result is cached for the lifetime of the process; call
+    _discover_ytdlp.cache_clear() after installing a new copy.
+    
+    Returns:
+        (command, status message) or None if no executable was found
+    """
+    # Check for yt-dlp in PATH (preferred)
+    ytdlp_path = shutil.which("yt-dlp")
+    if ytdlp_path:
+        return (ytdlp_path,), f"Using yt-dlp: {ytdlp_path}"
+    
+    # Check for youtube-dl in PATH
+    youtube_dl_path = shutil.which("youtube-dl")
+    if youtube_dl_path:
+        return (youtube_dl_path,), f"Using youtube-dl: {youtube_dl_path}"
+    
+    # Check for existing yt-dlp in our bin directory
+    if sys.platform == 'win32':
+        local_ytdlp = os.path.join(_BIN_DIR, "yt-dlp.exe")
+    else:
+        local_ytdlp = os.path.join(_BIN_DIR, "yt-dlp")
+    
+    if os.path.exists(local_ytdlp):
+        return (local_ytdlp,), f"Using local yt-dlp: {local_ytdlp}"
+    
+    # Check for yt-dlp in common Windows locations
+    if sys.platform == 'win32':
+        for path in [
+            os.path.join(os.environ.get('APPDATA', ''), 'yt-dlp', 'yt-dlp.exe'),
+            os.path.join(os.environ.get('LOCALAPPDATA', ''), 'yt-dlp', 'yt-dlp.exe'),
+            os.path.join(os.environ.get('PROGRAMFILES', ''), 'yt-dlp', 'yt-dlp.exe'),
+            os.path.join(os.environ.get('PROGRAMFILES(X86)', ''), 'yt-dlp', 'yt-dlp.exe')
+        ]:
+            if os.path.exists(path):
+                return (path,), f"Found yt-dlp at: {path}"
+    
+    return None
+
+
+@functools.lru_cache(maxsize=1)
+def _discover_ffmpeg() -> Optional[str]:
+    """
+    Try to find FFmpeg in standard locations
+    
+    The result is cached for the lifetime of the process; call
+    _discover_ffmpeg.cache_clear() after installing a new copy.
+    """
+    if sys.platform == 'win32':
+        # Check if FFmpeg is in our bin directory
+        ffmpeg_path = os.path.join(_BIN_DIR, "ffmpeg.exe")
+        if os.path.exists(ffmpeg_path):
+            return ffmpeg_path
+        
+        # Check Program Files
+        for program_files in [os.environ.get("ProgramFiles"), os.environ.get("ProgramFiles(x86)")]:
+            if program_files:
+                ffmpeg_path = os.path.join(program_files, "FFmpeg", "bin", "ffmpeg.exe")
+                if os.path.exists(ffmpeg_path):
+                    return ffmpeg_path
+    else:
+        # Mac or Linux
+        ffmpeg_path = os.path.join(_BIN_DIR, "ffmpeg")
+        if os.path.exists(ffmpeg_path):
+            return ffmpeg_path
+        
+        # Check system path
+        ffmpeg_path = shutil.which("ffmpeg")
+        if ffmpeg_path:
+            return ffmpeg_path
+            
+        # Check common locations on Mac
+        if sys.platform == 'darwin':
+            for path in ["/usr/local/bin/ffmpeg", "/opt/homebrew/bin/ffmpeg"]:
+                if os.path.exists(path):
+                    return path
+        
+        # Check common locations on Linux
+        elif sys.platform.startswith('linux'):
+            for path in ["/usr/bin/ffmpeg", "/usr/local/bin/ffmpeg"]:
+                if os.path.exists(path):
+                    return path
+    
+    return None
+
 
 class DownloaderSignals(QObject):
     """Signals for the YouTube downloader worker."""
@@ -24,11 +403,24 @@ class DownloaderSignals(QObject):
     error = Signal(str, str)  # (url, error_message)
     status_update = Signal(str)  # Status message for UI
 
+
+@dataclass
+class _DownloadContext:
+    """Inputs shared by every download strategy, prepared once per job."""
+    ytdlp_cmd: Optional[List[str]]  # None when no usable yt-dlp was found
+    command: Optional[List[str]]
+    env: Dict[str, str]
+
+
 class YouTubeDownloader(QRunnable):
     """Worker to download YouTube videos as MP3 files."""
     
+    # Per-tick progress reaches the UI thread at most ~30 times a second
+    PROGRESS_EMIT_INTERVAL = 1 / 30
+    
     def __init__(self, url: str, output_dir: str, filename: Optional[str] = None, 
-                 ffmpeg_path: Optional[str] = None, is_playlist: bool = False):
+                 ffmpeg_path: Optional[str] = None, is_playlist: bool = False,
+                 max_parallel: int = 4):
         """
         Initialize the downloader
         
@@ -38,6 +430,7 @@ class YouTubeDownloader(QRunnable):
             filename: Optional custom filename (without extension)
             ffmpeg_path: Optional path to FFmpeg executable
             is_playlist: Whether to download as a playlist
+            max_parallel: Number of playlist entries to download at once
         """
         super().__init__()
         self.url = url
@@ -45,14 +438,24 @@ class YouTubeDownloader(QRunnable):
         self.custom_filename = filename
         self.ffmpeg_path = ffmpeg_path
         self.is_playlist = is_playlist
+        self.max_parallel = max(1, max_parallel)
         self.signals = DownloaderSignals()
         self.is_cancelled = False
         self.playlist_items = None  # Will store info about playlist items if is_playlist=True
+        self._last_progress_emit = 0.0
+        self._resolved_ffmpeg = None  # Filled in by _ffmpeg() on first use
         
+    def _progress_due(self) -> bool:
+        """Return True if enough time has passed to send another progress tick."""
+        now = time.monotonic()
+        if now - self._last_progress_emit < self.PROGRESS_EMIT_INTERVAL:
+            return False
+        self._last_progress_emit = now
+        return True
+    
     def _validate_url(self) -> bool:
         """Check if the URL is a valid YouTube URL."""
-        youtube_regex = r'(https?://)?(www\.)?(youtube|youtu|youtube-nocookie)\.(com|be)/'
-        return bool(re.match(youtube_regex, self.url))
+        return bool(_YT_URL_RE.match(self.url))
     
     def _get_output_path(self, video_title: str) -> str:
         """Generate a valid output path based on title or custom filename"""
@@ -61,18 +464,18 @@ class YouTubeDownloader(QRunnable):
             filename = self.custom_filename
         else:
             # Clean up video title to make a valid filename
-            filename = re.sub(r'[\\/*?:"<>|]', '', video_title)
+            filename = video_title.translate(_SANITIZE_TABLE)
             
             # Format as Artist - Title if we can detect a good pattern
             if " - " not in filename:
                 # Try to extract artist from common YouTube patterns
-                artist_match = re.search(r'^(.*?)\s*[-–—:]\s*(.*?)$', filename)
+                artist_match = _DASH_RE.search(filename)
                 if artist_match:
                     artist, title = artist_match.groups()
                     filename = f"{artist.strip()} - {title.strip()}"
                 elif "by" in filename.lower():
                     # Look for "Title by Artist" pattern
-                    by_match = re.search(r'(.*)\s+by\s+(.*)', filename, re.IGNORECASE)
+                    by_match = _BY_RE.search(filename)
                     if by_match:
                         title, artist = by_match.groups()
                         filename = f"{artist.strip()} - {title.strip()}"
@@ -85,40 +488,11 @@ class YouTubeDownloader(QRunnable):
     
     def _get_ytdlp_command(self):
         """Get the command to run yt-dlp or youtube-dl with proper error checking."""
-        # Check for yt-dlp in PATH (preferred)
-        ytdlp_path = shutil.which("yt-dlp")
-        if ytdlp_path:
-            self.signals.status_update.emit(f"Using yt-dlp: {ytdlp_path}")
-            return [ytdlp_path]
-        
-        # Check for youtube-dl in PATH
-        youtube_dl_path = shutil.which("youtube-dl")
-        if youtube_dl_path:
-            self.signals.status_update.emit(f"Using youtube-dl: {youtube_dl_path}")
-            return [youtube_dl_path]
-        
-        # Check for existing yt-dlp in our bin directory
-        bin_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "bin")
-        if sys.platform == 'win32':
-            local_ytdlp = os.path.join(bin_path, "yt-dlp.exe")
-        else:
-            local_ytdlp = os.path.join(bin_path, "yt-dlp")
-        
-        if os.path.exists(local_ytdlp):
-            self.signals.status_update.emit(f"Using local yt-dlp: {local_ytdlp}")
-            return [local_ytdlp]
-        
-        # Check for yt-dlp in common Windows locations
-        if sys.platform == 'win32':
-            for path in [
-                os.path.join(os.environ.get('APPDATA', ''), 'yt-dlp', 'yt-dlp.exe'),
-                os.path.join(os.environ.get('LOCALAPPDATA', ''), 'yt-dlp', 'yt-dlp.exe'),
-                os.path.join(os.environ.get('PROGRAMFILES', ''), 'yt-dlp', 'yt-dlp.exe'),
-                os.path.join(os.environ.get('PROGRAMFILES(X86)', ''), 'yt-dlp', 'yt-dlp.exe')
-            ]:
-                if os.path.exists(path):
-                    self.signals.status_update.emit(f"Found yt-dlp at: {path}")
-                    return [path]
+        discovered = _discover_ytdlp()
+        if discovered:
+            cmd, message = discovered
+            self.signals.status_update.emit(message)
+            return list(cmd)
         
         # Try to download yt-dlp
         downloaded_path = self._download_ytdlp()
@@ -153,15 +527,15 @@ class YouTubeDownloader(QRunnable):
         else:
             return ["echo", error_msg]
 
-    def _build_command(self):
+    def _build_command(self, ytdlp_cmd=None):
         """Build the command to run youtube-dl or yt-dlp."""
         # Get the base command (either youtube-dl or yt-dlp)
-        ytdlp_cmd = self._get_ytdlp_command()
+        if ytdlp_cmd is None:
+            ytdlp_cmd = self._get_ytdlp_command()
         
         # Add ffmpeg location if available
-        ffmpeg_location = []
-        if self.ffmpeg_path:
-            ffmpeg_location = [f"--ffmpeg-location={self.ffmpeg_path}"]
+        ffmpeg_location = self._ffmpeg_location_args()
+        extractor_args = self._extractor_args(ytdlp_cmd)
         
         # Build different commands for playlist vs single video
         if self.is_playlist:
@@ -175,6 +549,9 @@ class YouTubeDownloader(QRunnable):
                 "--audio-format", "mp3",
                 "--audio-quality", "0",  # Best quality
                 *ffmpeg_location,
+                "--cache-dir", _YTDLP_CACHE_DIR,
+                *extractor_args,
+                *(["--lazy-playlist"] if extractor_args else []),  # Start on entries as they resolve
                 "--yes-playlist",  # Force playlist processing
                 "--no-abort-on-error",  # Don't abort on download errors
                 "-o", os.path.join(self.output_dir, "[%(playlist_index)03d] %(title)s.%(ext)s"),  # Use brackets for numbering
@@ -197,6 +574,8 @@ class YouTubeDownloader(QRunnable):
                 "--audio-format", "mp3",
                 "--audio-quality", "0",
                 *ffmpeg_location,
+                "--cache-dir", _YTDLP_CACHE_DIR,
+                *extractor_args,
                 "-o", output_path,  # Use separate args for -o option
                 "--restrict-filenames",  # Avoid encoding issues
                 "--verbose",  # Add verbose output for debugging
@@ -205,46 +584,212 @@ class YouTubeDownloader(QRunnable):
         
         return cmd
     
-    def _get_default_ffmpeg_path(self):
-        """Try to find FFmpeg in standard locations"""
-        # Check if FFmpeg is in our bin directory
-        bin_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "bin")
+    @staticmethod
+    def _is_youtube_dl(ytdlp_cmd) -> bool:
+        """Return True if the command runs youtube-dl rather than yt-dlp."""
+        return any('youtube-dl' in part or 'youtube_dl' in part for part in ytdlp_cmd)
+    
+    def _extractor_args(self, ytdlp_cmd):
+        """Return the yt-dlp-only speed flags; the youtube-dl fallback rejects them."""
+        if self._is_youtube_dl(ytdlp_cmd):
+            return []
+        return list(_FAST_EXTRACTOR_ARGS)
+    
+    def _ffmpeg_location_args(self):
+        """Return the yt-dlp arguments pointing it at our FFmpeg, if one was given."""
+        if self.ffmpeg_path:
+            return [f"--ffmpeg-location={self.ffmpeg_path}"]
+        return []
+    
+    def _enumerate_playlist(self, ytdlp_cmd, env):
+        """Resolve the entry URLs of a playlist without downloading anything."""
+        cached = _load_cached_meta(self.url)
+        if cached and cached.get('entries'):
+            self.signals.status_update.emit("Using cached playlist info")
+            return cached['entries']
         
-        if sys.platform == 'win32':
-            ffmpeg_path = os.path.join(bin_path, "ffmpeg.exe")
-            if os.path.exists(ffmpeg_path):
-                return ffmpeg_path
-            
-            # Check Program Files
-            for program_files in [os.environ.get("ProgramFiles"), os.environ.get("ProgramFiles(x86)")]:
-                if program_files:
-                    ffmpeg_path = os.path.join(program_files, "FFmpeg", "bin", "ffmpeg.exe")
-                    if os.path.exists(ffmpeg_path):
-                        return ffmpeg_path
-        else:
-            # Mac or Linux
-            ffmpeg_path = os.path.join(bin_path, "ffmpeg")
-            if os.path.exists(ffmpeg_path):
-                return ffmpeg_path
-            
-            # Check system path
-            ffmpeg_path = shutil.which("ffmpeg")
-            if ffmpeg_path:
-                return ffmpeg_path
-                
-            # Check common locations on Mac
-            if sys.platform == 'darwin':
-                for path in ["/usr/local/bin/ffmpeg", "/opt/homebrew/bin/ffmpeg"]:
-                    if os.path.exists(path):
-                        return path
-            
-            # Check common locations on Linux
-            elif sys.platform.startswith('linux'):
-                for path in ["/usr/bin/ffmpeg", "/usr/local/bin/ffmpeg"]:
-                    if os.path.exists(path):
-                        return path
+        result = subprocess.run(
+            [*ytdlp_cmd, "--flat-playlist", "--dump-single-json", "--cache-dir", _YTDLP_CACHE_DIR, self.url],
+            capture_output=True,
+            text=True,
+            errors='replace',
+            env=env,
+            **_SPAWN_KWARGS
+        )
+        if result.returncode != 0:
+            print(f"Could not enumerate playlist: {result.stderr.strip()}")
+            return []
         
-        return None
+        try:
+            info = json.loads(result.stdout)
+        except ValueError as e:
+            print(f"Could not parse playlist info: {e}")
+            return []
+        
+        entry_urls = []
+        for entry in info.get('entries') or []:
+            if not entry:
+                continue
+            entry_url = entry.get('url') or entry.get('webpage_url')
+            if not entry_url and entry.get('id'):
+                entry_url = f"https://www.youtube.com/watch?v={entry['id']}"
+            if entry_url:
+                entry_urls.append(entry_url)
+        
+        if entry_urls:
+            _store_cached_meta(self.url, {'title': info.get('title'), 'entries': entry_urls})
+        return entry_urls
+    
+    def _download_playlist_entry(self, ytdlp_cmd, env, index, entry_url, extract_audio):
+        """
+        Download a single playlist entry into its own staging directory
+        
+        With extract_audio, yt-dlp converts to MP3 itself; otherwise only the raw
+        audio stream is fetched. Returns the downloaded file path, or None.
+        """
+        if self.is_cancelled:
+            return None
+        
+        staging_dir = tempfile.mkdtemp(prefix="ytune_", dir=self.output_dir)
+        audio_args = ["--extract-audio", "--audio-format", "mp3", "--audio-quality", "0"] if extract_audio else []
+        cmd = [
+            *ytdlp_cmd,
+            "-f", "bestaudio",
+            *audio_args,
+            *self._ffmpeg_location_args(),
+            "--cache-dir", _YTDLP_CACHE_DIR,
+            *self._extractor_args(ytdlp_cmd),
+            "--no-playlist",
+            # Keep the playlist position in the name, same as the serial download
+            "-o", os.path.join(staging_dir, f"[{index:03d}] %(title)s.%(ext)s"),
+            "--restrict-filenames",
+            entry_url
+        ]
+        result = subprocess.run(cmd, capture_output=True, text=True, errors='replace', env=env,
+                                **_SPAWN_KWARGS)
+        
+        with os.scandir(staging_dir) as entries:
+            files = [e.path for e in entries if e.is_file() and not e.name.endswith('.part')]
+        if result.returncode != 0 or not files:
+            print(f"Error downloading playlist entry {index} ({entry_url}): {result.stderr.strip()}")
+            shutil.rmtree(staging_dir, ignore_errors=True)
+            return None
+        return files[0]
+    
+    def _finish_playlist_entry(self, file_path):
+        """Convert a staged playlist download to MP3 if needed and move it into the output directory."""
+        staging_dir = os.path.dirname(file_path)
+        try:
+            if not file_path.lower().endswith('.mp3'):
+                file_path = self._encode_playlist_mp3(file_path)
+            target_path = os.path.join(self.output_dir, os.path.basename(file_path))
+            shutil.move(file_path, target_path)
+            return target_path
+        except (OSError, subprocess.SubprocessError) as e:
+            print(f"Error finishing playlist entry {file_path}: {e}")
+            self.signals.status_update.emit(f"Could not convert {os.path.basename(file_path)} to MP3")
+            return None
+        finally:
+            shutil.rmtree(staging_dir, ignore_errors=True)
+    
+    def _encode_playlist_mp3(self, file_path):
+        """Encode a staged playlist download to VBR MP3, raising if FFmpeg fails."""
+        ffmpeg_path = self._ffmpeg()
+        if not ffmpeg_path:
+            raise OSError("FFmpeg not found")
+        mp3_path = os.path.splitext(file_path)[0] + '.mp3'
+        # Only errors are logged, so the captured stderr stays small
+        subprocess.run(
+            [ffmpeg_path, '-loglevel', 'error', '-i', file_path, *_MP3_VBR_ENCODE_ARGS, '-y', mp3_path],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            check=True,
+            **_SPAWN_KWARGS
+        )
+        return mp3_path
+    
+    def _download_playlist_parallel(self, ytdlp_cmd, env):
+        """
+        Download a playlist by running several yt-dlp processes at once
+        
+        Returns the output directory if at least one entry was downloaded,
+        or None so the caller can fall back to a single yt-dlp run.
+        """
+        self.signals.status_update.emit("Reading playlist...")
+        entry_urls = self._enumerate_playlist(ytdlp_cmd, env)
+        if not entry_urls:
+            return None
+        
+        self.total_videos = len(entry_urls)
+        self.signals.status_update.emit(f"Found {self.total_videos} videos in playlist")
+        self.signals.progress.emit(0)
+        
+        # When we can run FFmpeg ourselves, yt-dlp only fetches the audio and the
+        # MP3 encode runs on a separate pool, so encoding one entry overlaps the
+        # download of the next instead of blocking that yt-dlp process
+        extract_audio = not self._ffmpeg()
+        
+        total_steps = self.total_videos * 2  # download + convert per entry
+        finished_steps = 0
+        downloaded = 0
+        saved = 0
+        with ThreadPoolExecutor(max_workers=self.max_parallel) as download_pool, \
+                ThreadPoolExecutor(max_workers=os.cpu_count() or 1) as convert_pool:
+            downloads = {
+                download_pool.submit(self._download_playlist_entry, ytdlp_cmd, env, index, entry_url, extract_audio)
+                for index, entry_url in enumerate(entry_urls, start=1)
+            }
+            pending = set(downloads)
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    finished_steps += 1
+                    if future in downloads:
+                        downloaded += 1
+                        file_path = future.result()
+                        if file_path:
+                            pending.add(convert_pool.submit(self._finish_playlist_entry, file_path))
+                        else:
+                            finished_steps += 1  # Nothing to convert
+                        self.signals.status_update.emit(f"Downloaded [{downloaded}/{self.total_videos}]")
+                    elif future.result():
+                        saved += 1
+                self.signals.progress.emit(min(finished_steps / total_steps * 100, 99.9))
+        
+        if self.is_cancelled or not saved:
+            return None
+        
+        self.signals.progress.emit(100)
+        self.signals.status_update.emit(f"Playlist download complete! Downloaded {saved} tracks.")
+        return self.output_dir
+    
+    def _ffmpeg(self) -> Optional[str]:
+        """
+        Return a usable FFmpeg path for this job, resolved once and reused
+        
+        If none is installed, one is downloaded into the app's bin directory.
+        """
+        if self._resolved_ffmpeg is None:
+            for candidate in (self.ffmpeg_path, self._get_default_ffmpeg_path()):
+                if candidate and os.path.exists(candidate):
+                    self._resolved_ffmpeg = candidate
+                    break
+            else:
+                self._resolved_ffmpeg = ""
+                with _FFMPEG_INSTALL_LOCK:
+                    # Another job may have installed it while we waited
+                    _discover_ffmpeg.cache_clear()
+                    installed = _discover_ffmpeg()
+                    if installed:
+                        self.ffmpeg_path = installed
+                    elif not self._try_download_ffmpeg():
+                        return None
+                self._resolved_ffmpeg = self.ffmpeg_path
+        return self._resolved_ffmpeg or None
+    
+    def _get_default_ffmpeg_path(self):
+        """Try to find FFmpeg in standard locations"""
+        return _discover_ffmpeg()
     
     def _try_download_ffmpeg(self):
         """
@@ -254,102 +799,50 @@ class YouTubeDownloader(QRunnable):
         self.signals.status_update.emit("Attempting to download FFmpeg automatically...")
         
         system = platform.system().lower()
-        ffmpeg_base_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "bin")
+        machine = platform.machine().lower()
+        machine = _MACHINE_ALIASES.get(machine, machine)
+        mirrors = _FFMPEG_MIRRORS.get((system, machine))
+        if not mirrors:
+            self.signals.status_update.emit(f"Unsupported platform: {system} ({machine})")
+            return False
+        
+        binary_name = "ffmpeg.exe" if system == "windows" else "ffmpeg"
         
         # Create bin directory if it doesn't exist
-        os.makedirs(ffmpeg_base_path, exist_ok=True)
+        os.makedirs(_BIN_DIR, exist_ok=True)
         
         temp_dir = tempfile.mkdtemp()
-        download_path = os.path.join(temp_dir, "ffmpeg.zip")
         
         try:
-            if system == "windows":
-                # Download Windows binary
-                url = "https://github.com/BtbN/FFmpeg-Builds/releases/download/latest/ffmpeg-master-latest-win64-gpl.zip"
-                self.signals.status_update.emit(f"Downloading Windows FFmpeg from {url}...")
-                urlretrieve(url, download_path)
-                
-                # Extract the zip file
-                with zipfile.ZipFile(download_path, 'r') as zip_ref:
-                    zip_ref.extractall(temp_dir)
-                
-                # Find the ffmpeg.exe in the extracted folders
-                found = False
-                for root, dirs, files in os.walk(temp_dir):
-                    if "ffmpeg.exe" in files:
-                        ffmpeg_src = os.path.join(root, "ffmpeg.exe")
-                        ffmpeg_dst = os.path.join(ffmpeg_base_path, "ffmpeg.exe")
-                        shutil.copy2(ffmpeg_src, ffmpeg_dst)
-                        self.ffmpeg_path = ffmpeg_dst
-                        found = True
-                        break
-                
-                if not found:
-                    # Try alternative URL if first one failed
-                    url = "https://www.gyan.dev/ffmpeg/builds/ffmpeg-release-essentials.zip"
-                    self.signals.status_update.emit(f"Trying alternative Windows FFmpeg from {url}...")
-                    urlretrieve(url, download_path)
-                    
-                    # Extract the zip file
-                    with zipfile.ZipFile(download_path, 'r') as zip_ref:
-                        zip_ref.extractall(temp_dir)
-                    
-                    # Find the ffmpeg.exe in the extracted folders
-                    for root, dirs, files in os.walk(temp_dir):
-                        if "ffmpeg.exe" in files:
-                            ffmpeg_src = os.path.join(root, "ffmpeg.exe")
-                            ffmpeg_dst = os.path.join(ffmpeg_base_path, "ffmpeg.exe")
-                            shutil.copy2(ffmpeg_src, ffmpeg_dst)
-                            self.ffmpeg_path = ffmpeg_dst
-                            found = True
-                            break
-            
-            elif system == "darwin":  # macOS
-                # Download macOS binary
-                url = "https://evermeet.cx/ffmpeg/getrelease/ffmpeg/zip"
-                self.signals.status_update.emit(f"Downloading macOS FFmpeg from {url}...")
-                urlretrieve(url, download_path)
-                
-                # Extract the zip file
-                with zipfile.ZipFile(download_path, 'r') as zip_ref:
-                    zip_ref.extractall(temp_dir)
-                
-                # Find the ffmpeg binary
-                ffmpeg_src = os.path.join(temp_dir, "ffmpeg")
-                ffmpeg_dst = os.path.join(ffmpeg_base_path, "ffmpeg")
-                shutil.copy2(ffmpeg_src, ffmpeg_dst)
-                os.chmod(ffmpeg_dst, 0o755)  # Make executable
-                self.ffmpeg_path = ffmpeg_dst
-            
-            elif system == "linux":
-                # Download Linux binary
-                url = "https://johnvansickle.com/ffmpeg/releases/ffmpeg-release-amd64-static.tar.xz"
-                self.signals.status_update.emit(f"Downloading Linux FFmpeg from {url}...")
-                urlretrieve(url, download_path)
-                
-                # Extract the tar.xz file
-                shutil.unpack_archive(download_path, temp_dir)
+            for url in _rank_mirrors(mirrors):
+                self.signals.status_update.emit(f"Downloading FFmpeg from {url}...")
+                try:
+                    if url.endswith("zip"):
+                        # zipfile needs a seekable file, so the archive goes to disk first
+                        download_path = os.path.join(temp_dir, "ffmpeg.zip")
+                        _fetch(url, download_path)
+                        ffmpeg_src = _extract_zip_member(download_path, binary_name, temp_dir)
+                    else:
+                        ffmpeg_src = _stream_tar_member(url, binary_name, temp_dir)
+                except Exception as e:
+                    print(f"FFmpeg download from {url} failed: {e}")
+                    continue
                 
-                # Find the ffmpeg binary in the extracted folder
-                for root, dirs, files in os.walk(temp_dir):
-                    if "ffmpeg" in files:
-                        ffmpeg_src = os.path.join(root, "ffmpeg")
-                        ffmpeg_dst = os.path.join(ffmpeg_base_path, "ffmpeg")
-                        shutil.copy2(ffmpeg_src, ffmpeg_dst)
-                        os.chmod(ffmpeg_dst, 0o755)  # Make executable
-                        self.ffmpeg_path = ffmpeg_dst
-                        break
-            
-            else:
-                self.signals.status_update.emit(f"Unsupported platform: {system}")
-                return False
+                if ffmpeg_src:
+                    ffmpeg_dst = os.path.join(_BIN_DIR, binary_name)
+                    _install_binary(ffmpeg_src, ffmpeg_dst, executable=(system != "windows"))
+                    self.ffmpeg_path = ffmpeg_dst
+                    break
             
             # Verify that FFmpeg was downloaded and is executable
-            if hasattr(self, 'ffmpeg_path') and os.path.exists(self.ffmpeg_path):
+            if self.ffmpeg_path and os.path.exists(self.ffmpeg_path):
+                _discover_ffmpeg.cache_clear()
                 self.signals.status_update.emit(f"FFmpeg downloaded successfully to: {self.ffmpeg_path}")
                 return True
             else:
-                self.signals.status_update.emit("Failed to download FFmpeg: File not found after download")
+                self.signals.status_update.emit(
+                    f"Failed to download FFmpeg: none of the {len(mirrors)} mirror(s) for {system} ({machine}) worked"
+                )
                 return False
                 
         except Exception as e:
@@ -375,385 +868,468 @@ class YouTubeDownloader(QRunnable):
             # Ensure output directory exists
             os.makedirs(self.output_dir, exist_ok=True)
             
-            # Try using Python module directly as a last resort
-            def try_python_module_directly():
-                self.signals.status_update.emit("Trying direct Python module integration...")
-                try:
-                    # Try importing yt-dlp module
-                    try:
-                        import yt_dlp as ytdl
-                    except ImportError:
-                        try:
-                            import youtube_dl as ytdl
-                        except ImportError:
-                            self.signals.error.emit(self.url, "Could not import yt-dlp or youtube-dl modules")
-                            return None
-                    
-                    # Configure options
-                    output_template = os.path.join(self.output_dir, '%(title)s.%(ext)s')
-                    if self.is_playlist:
-                        output_template = os.path.join(self.output_dir, '[%(playlist_index)03d] %(title)s.%(ext)s')
-                    
-                    ydl_opts = {
-                        'format': 'bestaudio/best',
-                        'outtmpl': output_template,
-                        'restrictfilenames': True,
-                        'ignoreerrors': True,
-                        'nooverwrites': True,
-                        'noplaylist': not self.is_playlist,
-                        'postprocessors': [{
-                            'key': 'FFmpegExtractAudio',
-                            'preferredcodec': 'mp3',
-                            'preferredquality': '192',
-                        }],
-                        'progress_hooks': [self._ytdl_progress_hook],
-                    }
-                    
-                    # Add FFmpeg location if available
-                    if self.ffmpeg_path and os.path.exists(self.ffmpeg_path):
-                        ydl_opts['ffmpeg_location'] = self.ffmpeg_path
-                    
-                    # Print options for debugging
-                    print(f"Direct module options: {ydl_opts}")
-                    self.signals.status_update.emit("Starting download with direct module integration")
-                    
-                    # Actually run the download
-                    with ytdl.YoutubeDL(ydl_opts) as ydl:
-                        info = ydl.extract_info(self.url, download=True)
-                    
-                    # Check if we got results
-                    if not info:
-                        self.signals.error.emit(self.url, "Failed to get video information")
-                        return None
-                    
-                    # Get the output file path
-                    if self.is_playlist and 'entries' in info:
-                        self.signals.status_update.emit(f"Playlist download complete")
-                        self.signals.progress.emit(100)
-                        return self.output_dir
-                    elif not self.is_playlist:
-                        # Try to find the downloaded file
-                        filename = ytdl.prepare_filename(info)
-                        mp3_path = os.path.splitext(filename)[0] + '.mp3'
-                        
-                        if os.path.exists(mp3_path):
-                            self.signals.status_update.emit(f"Download complete: {os.path.basename(mp3_path)}")
-                            self.signals.progress.emit(100)
-                            return mp3_path
-                        
-                    # Look for any MP3 files created in the last minute
-                    recent_files = []
-                    one_minute_ago = time.time() - 60
-                    for filename in os.listdir(self.output_dir):
-                        filepath = os.path.join(self.output_dir, filename)
-                        if (os.path.isfile(filepath) and 
-                            filepath.endswith('.mp3') and 
-                            os.path.getmtime(filepath) > one_minute_ago):
-                            recent_files.append(filepath)
-                    
-                    if recent_files:
-                        newest_file = max(recent_files, key=os.path.getmtime)
-                        self.signals.status_update.emit(f"Download complete: {os.path.basename(newest_file)}")
-                        self.signals.progress.emit(100)
-                        return newest_file
-                    
-                    # Still not found but we had info
-                    self.signals.status_update.emit("Download completed but file location unknown")
-                    self.signals.progress.emit(100)
-                    return self.output_dir
-                    
-                except Exception as e:
-                    print(f"Direct module approach failed: {str(e)}")
-                    traceback.print_exc()
-                    return None
+            # Executable discovery and the command line are worked out once here
+            # and shared by every strategy below
+            ctx = self._prepare_context()
             
-            # First try with yt-dlp/youtube-dl
-            try:
-                # Prepare command
-                youtube_dl_cmd = self._build_command()
-                
-                # Validate the command before running
-                if not youtube_dl_cmd or len(youtube_dl_cmd) < 2:
-                    self.signals.status_update.emit("YouTube downloader executable not found. Trying alternative method...")
-                    raise FileNotFoundError("YouTube downloader executable not found")
-                    
-                # Log what we're about to execute
-                cmd_str = " ".join(youtube_dl_cmd)
-                print(f"Executing: {cmd_str}")
-                self.signals.status_update.emit(f"Starting download: {self.url}")
-                
-                # Check if the executable actually exists
-                if not os.path.exists(youtube_dl_cmd[0]) and not shutil.which(youtube_dl_cmd[0]):
-                    # Special handling for Python module commands
-                    if youtube_dl_cmd[0] == sys.executable and len(youtube_dl_cmd) > 1 and youtube_dl_cmd[1] == "-m":
-                        print(f"Running as Python module: {' '.join(youtube_dl_cmd)}")
-                    else:
-                        self.signals.status_update.emit(f"Cannot find executable: {youtube_dl_cmd[0]}. Trying alternative method...")
-                        raise FileNotFoundError(f"Cannot find executable: {youtube_dl_cmd[0]}")
-                
-                # Set environment variables for encoding
-                env = os.environ.copy()
-                env["PYTHONIOENCODING"] = "utf-8"
+            # Tried in order until one produces a file or directory
+            strategies = [
+                self._try_playlist_parallel,
+                self._try_piped_transcode,
+                self._try_subprocess_simple,
+                self._try_subprocess_advanced,
+                self._try_pytube,
+                self._try_module,
+            ]
+            for strategy in strategies:
+                if self.is_cancelled:
+                    self.signals.error.emit(self.url, "Download cancelled")
+                    return
                 
-                # Try downloading with a simple process call first
                 try:
-                    # Create a temporary directory for more predictable output paths
-                    temp_dir = os.path.join(self.output_dir, f"temp_{uuid.uuid4().hex[:8]}")
-                    os.makedirs(temp_dir, exist_ok=True)
-                    
-                    # Modify the command to use the temp directory
-                    modified_cmd = youtube_dl_cmd.copy()
-                    for i, arg in enumerate(modified_cmd):
-                        if arg.startswith("-o=") or arg.startswith("-o "):
-                            # Replace output template
-                            modified_cmd[i] = f"-o={os.path.join(temp_dir, '%(title)s.%(ext)s')}"
-                        elif i > 0 and modified_cmd[i-1] == "-o":
-                            # Replace output path
-                            modified_cmd[i] = os.path.join(temp_dir, "%(title)s.%(ext)s")
-                    
-                    # Run the process directly for better reliability
-                    print(f"Running simplified command: {' '.join(modified_cmd)}")
-                    process_result = subprocess.run(
-                        modified_cmd,
-                        capture_output=True,
-                        text=True,
-                        errors='replace',
-                        env=env
-                    )
-                    
-                    # Check for files in the temp directory
-                    downloaded_files = []
-                    for file in os.listdir(temp_dir):
-                        file_path = os.path.join(temp_dir, file)
-                        if os.path.isfile(file_path) and file.endswith('.mp3'):
-                            downloaded_files.append(file_path)
-                    
-                    if downloaded_files:
-                        # Move the file to the target directory
-                        for file_path in downloaded_files:
-                            target_path = os.path.join(self.output_dir, os.path.basename(file_path))
-                            shutil.move(file_path, target_path)
-                            self.signals.status_update.emit(f"Download complete: {os.path.basename(target_path)}")
-                            self.signals.finished.emit(self.url, target_path)
-                            return
-                    
-                    # If we get here, the simplified approach didn't work
-                    # Check for errors in the output
-                    error_output = process_result.stderr
-                    if error_output and "ERROR:" in error_output:
-                        print(f"yt-dlp error: {error_output}")
-                        raise Exception(f"yt-dlp error: {error_output.strip()}")
-                    
-                    # If no direct error, continue with the more complex approach
-                    raise Exception("No files downloaded, trying alternate method")
-                    
+                    output_file = strategy(ctx)
                 except Exception as e:
-                    print(f"Simple approach failed: {str(e)}, trying advanced method...")
-                    # Continue to the more complex approach with pipe handling
-                
-                    # Start the process with pipe handling
-                    process = subprocess.Popen(
-                        youtube_dl_cmd,
-                        stdout=subprocess.PIPE,
-                        stderr=subprocess.PIPE,
-                        universal_newlines=False,  # Get byte streams
-                        bufsize=0,  # Unbuffered for binary mode
-                        env=env
-                    )
-                    
-                    # Process the download and get the output file
-                    output_file = self._process_download(process)
-                    
-                    # If the output file is None, there was an error
-                    if not output_file:
-                        raise Exception("Failed to download with yt-dlp")
-                    
-                    # Success with yt-dlp
-                    basename = os.path.basename(output_file) if output_file else "Unknown"
-                    self.signals.status_update.emit(f"Download complete: {basename}")
-                    self.signals.finished.emit(self.url, output_file)
-                    return
-                
-            except (FileNotFoundError, PermissionError, Exception) as e:
-                # First attempt failed, try pytube fallback
-                print(f"yt-dlp download failed: {str(e)}. Trying pytube fallback...")
-                self.signals.status_update.emit("First download method failed. Trying alternative...")
-                
-                # Try using pytube as a fallback
-                output_file = self._download_with_pytube()
+                    print(f"{strategy.__name__} failed: {str(e)}")
+                    continue
                 
                 if output_file:
-                    # Success with pytube
-                    if os.path.isdir(output_file):
-                        self.signals.status_update.emit("Playlist download complete!")
-                    else:
-                        basename = os.path.basename(output_file)
-                        self.signals.status_update.emit(f"Download complete: {basename}")
-                        
                     self.signals.finished.emit(self.url, output_file)
                     return
-                else:
-                    # Both methods failed
-                    self.signals.error.emit(self.url, "All download methods failed. Please try again later.")
-                    return
-            
-            # After all other methods fail, try direct module integration
-            self.signals.status_update.emit("All download methods failed. Trying final approach...")
-            output_file = try_python_module_directly()
             
-            if output_file:
-                # Success with direct module integration
-                if os.path.isdir(output_file):
-                    # Count how many MP3 files were downloaded 
-                    mp3_count = 0
-                    for filename in os.listdir(output_file):
-                        if filename.endswith('.mp3'):
-                            mp3_count += 1
-                    
-                    if mp3_count > 0:
-                        self.signals.status_update.emit(f"Playlist download complete! Downloaded {mp3_count} tracks.")
-                    else:
-                        self.signals.status_update.emit("Playlist download complete!")
-                else:
-                    basename = os.path.basename(output_file)
-                    self.signals.status_update.emit(f"Download complete: {basename}")
-                    
-                self.signals.finished.emit(self.url, output_file)
-                return
-            else:
-                # All methods failed
-                self.signals.error.emit(self.url, "All download methods failed. Please check the URL and try again later.")
-                return
+            # All methods failed
+            self.signals.error.emit(self.url, "All download methods failed. Please check the URL and try again later.")
             
         except Exception as e:
             print(f"Error in downloader: {str(e)}")
             traceback.print_exc()
             self.signals.error.emit(self.url, str(e))
             return
+    
+    def _prepare_context(self) -> _DownloadContext:
+        """Resolve the yt-dlp command and process environment for this job."""
+        # Set environment variables for encoding
+        env = os.environ.copy()
+        env["PYTHONIOENCODING"] = "utf-8"
+        
+        try:
+            ytdlp_cmd = self._get_ytdlp_command()
+            youtube_dl_cmd = self._build_command(ytdlp_cmd)
+        except Exception as e:
+            print(f"Could not prepare yt-dlp command: {str(e)}")
+            return _DownloadContext(None, None, env)
+        
+        # Validate the command before running
+        if not youtube_dl_cmd or len(youtube_dl_cmd) < 2:
+            self.signals.status_update.emit("YouTube downloader executable not found. Trying alternative method...")
+            return _DownloadContext(None, None, env)
+        
+        # Check if the executable actually exists
+        if not os.path.exists(youtube_dl_cmd[0]) and not shutil.which(youtube_dl_cmd[0]):
+            # Special handling for Python module commands
+            if youtube_dl_cmd[0] == sys.executable and len(youtube_dl_cmd) > 1 and youtube_dl_cmd[1] == "-m":
+                print(f"Running as Python module: {' '.join(youtube_dl_cmd)}")
+            else:
+                self.signals.status_update.emit(f"Cannot find executable: {youtube_dl_cmd[0]}. Trying alternative method...")
+                return _DownloadContext(None, None, env)
+        
+        # Log what we're about to execute
+        print(f"Executing: {' '.join(youtube_dl_cmd)}")
+        self.signals.status_update.emit(f"Starting download: {self.url}")
+        return _DownloadContext(ytdlp_cmd, youtube_dl_cmd, env)
+    
+    def _try_playlist_parallel(self, ctx: _DownloadContext) -> Optional[str]:
+        """Fan a playlist out over several yt-dlp processes."""
+        # Per-stream throttling would otherwise serialize the whole download
+        if not self.is_playlist or not ctx.command:
+            return None
+        output_dir = self._download_playlist_parallel(ctx.ytdlp_cmd, ctx.env)
+        if not output_dir and not self.is_cancelled:
+            print("Parallel playlist download failed, falling back to a single yt-dlp run...")
+        return output_dir
+    
+    def _try_piped_transcode(self, ctx: _DownloadContext) -> Optional[str]:
+        """
+        Stream a single video from yt-dlp's stdout straight into FFmpeg's stdin
+        
+        The downloaded container never touches the disk, so there is no
+        intermediate file to re-read and delete. Needs yt-dlp and a local FFmpeg.
+        """
+        if self.is_playlist or not ctx.command or self._is_youtube_dl(ctx.ytdlp_cmd):
+            return None
+        # Resolved only once the strategy applies, since it may download FFmpeg
+        ffmpeg_path = self._ffmpeg()
+        if not ffmpeg_path:
+            return None
+        
+        staging_dir = tempfile.mkdtemp(prefix="ytune_", dir=self.output_dir)
+        try:
+            mp3_tmp = os.path.join(staging_dir, "audio.mp3")
+            title_file = os.path.join(staging_dir, "title.txt")
+            ytdlp_cmd = [
+                *ctx.ytdlp_cmd,
+                "-f", "bestaudio",
+                "--cache-dir", _YTDLP_CACHE_DIR,
+                *self._extractor_args(ctx.ytdlp_cmd),
+                "--no-playlist",
+                "--no-part",
+                # FILE is an output template, so a literal % has to be doubled
+                "--print-to-file", "before_dl:%(title)s", title_file.replace('%', '%%'),
+                "-o", "-",
+                self.url
+            ]
+            ffmpeg_cmd = [ffmpeg_path, '-hide_banner', '-loglevel', 'error',
+                          '-i', 'pipe:0', *_MP3_VBR_ENCODE_ARGS, '-y', mp3_tmp]
+            
+            self.signals.status_update.emit("Downloading and converting to MP3...")
+            print(f"Piping: {' '.join(ytdlp_cmd)} | {' '.join(ffmpeg_cmd)}")
+            
+            with open(os.path.join(staging_dir, "yt-dlp.log"), "wb") as ytdlp_log:
+                ytdlp = subprocess.Popen(ytdlp_cmd, stdout=subprocess.PIPE, stderr=ytdlp_log,
+                                         env=ctx.env, **_SPAWN_KWARGS)
+                ffmpeg = subprocess.Popen(ffmpeg_cmd, stdin=ytdlp.stdout, stdout=subprocess.DEVNULL,
+                                          stderr=subprocess.DEVNULL, **_SPAWN_KWARGS)
+                # Only FFmpeg holds the read end now, so it sees EOF when yt-dlp exits
+                ytdlp.stdout.close()
+                
+                while True:
+                    try:
+                        ffmpeg.wait(timeout=0.5)
+                        break
+                    except subprocess.TimeoutExpired:
+                        if self.is_cancelled:
+                            ytdlp.kill()
+                            ffmpeg.kill()
+                            ffmpeg.wait()
+                            break
+                ytdlp.wait()
+            
+            if self.is_cancelled:
+                return None
+            if ytdlp.returncode != 0 or ffmpeg.returncode != 0 or not os.path.getsize(mp3_tmp):
+                print(f"Piped download failed (yt-dlp {ytdlp.returncode}, ffmpeg {ffmpeg.returncode})")
+                return None
+            
+            title = ""
+            if os.path.exists(title_file):
+                with open(title_file, "r", encoding="utf-8", errors="replace") as f:
+                    title = f.read().strip()
+            # Same names the yt-dlp strategies produce: the custom name as given
+            # (minus path separators), otherwise the title under --restrict-filenames
+            if self.custom_filename:
+                base_name = self._sanitize_filename(self.custom_filename)
+            else:
+                base_name = self._sanitize_filename(_restrict_filename(title))
+            mp3_path = _unique_path(os.path.join(self.output_dir, f"{base_name or 'audio'}.mp3"))
+            os.replace(mp3_tmp, mp3_path)
+            
+            self.signals.progress.emit(100)
+            self.signals.status_update.emit(f"Download complete: {os.path.basename(mp3_path)}")
+            return mp3_path
+        except OSError as e:
+            print(f"Piped download failed: {str(e)}")
+            return None
+        finally:
+            shutil.rmtree(staging_dir, ignore_errors=True)
+    
+    def _try_subprocess_simple(self, ctx: _DownloadContext) -> Optional[str]:
+        """Run yt-dlp to completion into a staging directory, then move the results."""
+        if not ctx.command:
+            return None
+        
+        # Create a temporary directory for more predictable output paths
+        temp_dir = tempfile.mkdtemp(prefix="ytune_", dir=self.output_dir)
+        try:
+            # Modify the command to use the temp directory
+            modified_cmd = list(ctx.command)
+            for i, arg in enumerate(modified_cmd):
+                if arg.startswith("-o=") or arg.startswith("-o "):
+                    # Replace output template
+                    modified_cmd[i] = f"-o={os.path.join(temp_dir, '%(title)s.%(ext)s')}"
+                elif i > 0 and modified_cmd[i-1] == "-o":
+                    # Replace output path
+                    modified_cmd[i] = os.path.join(temp_dir, "%(title)s.%(ext)s")
+            
+            # Run the process directly for better reliability
+            print(f"Running simplified command: {' '.join(modified_cmd)}")
+            process_result = subprocess.run(
+                modified_cmd,
+                capture_output=True,
+                text=True,
+                errors='replace',
+                env=ctx.env,
+                **_SPAWN_KWARGS
+            )
+            
+            # Check for files in the temp directory
+            with os.scandir(temp_dir) as it:
+                downloaded_files = [entry.path for entry in it
+                                    if entry.name.endswith('.mp3') and entry.is_file()]
+            
+            if downloaded_files:
+                # The staging dir sits inside output_dir, so each move is a plain rename
+                moved = []
+                for file_path in downloaded_files:
+                    target_path = os.path.join(self.output_dir, os.path.basename(file_path))
+                    os.replace(file_path, target_path)
+                    moved.append(target_path)
+                
+                if len(moved) == 1:
+                    self.signals.status_update.emit(f"Download complete: {os.path.basename(moved[0])}")
+                    return moved[0]
+                self.signals.status_update.emit(f"Playlist download complete! Downloaded {len(moved)} tracks.")
+                return self.output_dir
+            
+            # If we get here, the simplified approach didn't work
+            # Check for errors in the output
+            error_output = process_result.stderr
+            if error_output and "ERROR:" in error_output:
+                print(f"yt-dlp error: {error_output}")
+            return None
+        finally:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+    
+    def _try_subprocess_advanced(self, ctx: _DownloadContext) -> Optional[str]:
+        """Run yt-dlp with live progress parsing from its output pipes."""
+        if not ctx.command:
+            return None
+        
+        # Start the process with pipe handling
+        process = subprocess.Popen(
+            ctx.command,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            universal_newlines=False,  # Get byte streams
+            bufsize=_PIPE_CHUNK_SIZE,
+            env=ctx.env,
+            **_SPAWN_KWARGS
+        )
+        
+        # Process the download and get the output file
+        output_file = self._process_download(process)
+        if output_file:
+            self.signals.status_update.emit(f"Download complete: {os.path.basename(output_file)}")
+        return output_file
+    
+    def _try_pytube(self, ctx: _DownloadContext) -> Optional[str]:
+        """Fall back to pytube when yt-dlp could not produce a file."""
+        self.signals.status_update.emit("First download method failed. Trying alternative...")
+        output_file = self._download_with_pytube()
+        
+        if output_file:
+            if os.path.isdir(output_file):
+                self.signals.status_update.emit("Playlist download complete!")
+            else:
+                self.signals.status_update.emit(f"Download complete: {os.path.basename(output_file)}")
+        return output_file
+    
+    def _try_module(self, ctx: _DownloadContext) -> Optional[str]:
+        """Last resort: drive the yt-dlp/youtube-dl Python module in-process."""
+        self.signals.status_update.emit("Trying direct Python module integration...")
+        
+        # Try importing yt-dlp module
+        try:
+            import yt_dlp as ytdl
+        except ImportError:
+            try:
+                import youtube_dl as ytdl
+            except ImportError:
+                print("Could not import yt-dlp or youtube-dl modules")
+                return None
+        
+        # Configure options
+        output_template = os.path.join(self.output_dir, '%(title)s.%(ext)s')
+        if self.is_playlist:
+            output_template = os.path.join(self.output_dir, '[%(playlist_index)03d] %(title)s.%(ext)s')
+        
+        ydl_opts = {
+            'format': 'bestaudio/best',
+            'outtmpl': output_template,
+            'restrictfilenames': True,
+            'ignoreerrors': True,
+            'nooverwrites': True,
+            'noplaylist': not self.is_playlist,
+            'postprocessors': [{
+                'key': 'FFmpegExtractAudio',
+                'preferredcodec': 'mp3',
+                'preferredquality': '192',
+            }],
+            'progress_hooks': [self._ytdl_progress_hook],
+            'cachedir': _YTDLP_CACHE_DIR,
+        }
+        
+        # Add FFmpeg location if available
+        if self.ffmpeg_path and os.path.exists(self.ffmpeg_path):
+            ydl_opts['ffmpeg_location'] = self.ffmpeg_path
+        
+        # Print options for debugging
+        print(f"Direct module options: {ydl_opts}")
+        self.signals.status_update.emit("Starting download with direct module integration")
+        
+        # Actually run the download
+        with ytdl.YoutubeDL(ydl_opts) as ydl:
+            info = ydl.extract_info(self.url, download=True)
+        
+        # Check if we got results
+        if not info:
+            print("Failed to get video information")
+            return None
+        
+        # Get the output file path
+        if self.is_playlist and 'entries' in info:
+            self.signals.status_update.emit(f"Playlist download complete")
+            self.signals.progress.emit(100)
+            return self.output_dir
+        elif not self.is_playlist:
+            # Try to find the downloaded file
+            filename = ytdl.prepare_filename(info)
+            mp3_path = os.path.splitext(filename)[0] + '.mp3'
+            
+            if os.path.exists(mp3_path):
+                self.signals.status_update.emit(f"Download complete: {os.path.basename(mp3_path)}")
+                self.signals.progress.emit(100)
+                return mp3_path
+            
+        # Look for any MP3 files created in the last minute
+        newest_file = _newest_recent_file(self.output_dir, time.time() - 60, '.mp3')
+        if newest_file:
+            self.signals.status_update.emit(f"Download complete: {os.path.basename(newest_file)}")
+            self.signals.progress.emit(100)
+            return newest_file
+        
+        # Still not found but we had info
+        self.signals.status_update.emit("Download completed but file location unknown")
+        self.signals.progress.emit(100)
+        return self.output_dir
 
+    @staticmethod
+    def _pump_pipe(pipe, name, lines):
+        """Forward the lines of a process pipe to a queue; None marks EOF.
+        
+        Reads whatever is available, up to 64 KiB at a time, and splits on both
+        newlines and carriage returns since yt-dlp redraws its progress line in place.
+        All complete lines from one read go onto the queue as a single batch.
+        """
+        pending = b''
+        try:
+            while True:
+                chunk = pipe.read1(_PIPE_CHUNK_SIZE)
+                if not chunk:
+                    break
+                parts = (pending + chunk).replace(b'\r', b'\n').split(b'\n')
+                pending = parts.pop()
+                batch = [raw for raw in parts if raw]
+                if batch:
+                    lines.put((name, batch))
+            if pending:
+                lines.put((name, [pending]))
+        except (IOError, OSError, ValueError):
+            pass
+        finally:
+            lines.put((name, None))
+    
     def _process_download(self, process):
         """Process the download and emit progress signals."""
         # Initialize variables for tracking playlist download progress
         self.current_video = 0
         self.total_videos = 1  # Default to 1 for single video
         output_file = None
+        output_name = 'video'  # basename of output_file, updated only when it changes
+        last_progress = -1.0
         
-        import select
-        import time
-
-        # Loop until process completes
-        while process.poll() is None and not self.is_cancelled:
+        # Reader threads block on the pipes and hand complete lines over, so this
+        # loop sleeps until output actually arrives instead of polling
+        lines = queue.Queue()
+        readers = [
+            threading.Thread(target=self._pump_pipe, args=(pipe, name, lines), daemon=True)
+            for name, pipe in (('stdout', process.stdout), ('stderr', process.stderr))
+        ]
+        for reader in readers:
+            reader.start()
+        open_pipes = len(readers)
+        
+        # Loop until both pipes are closed
+        while open_pipes and not self.is_cancelled:
             try:
-                # Check which file descriptors are ready to read without blocking
-                if sys.platform == 'win32':
-                    # Windows doesn't support select on pipes, so just read with timeout
-                    line = b''
-                    error_line = b''
-                    
-                    # Read from stdout if data available
-                    try:
-                        line = process.stdout.readline()
-                    except (IOError, OSError):
-                        pass
-                        
-                    # Read from stderr if data available    
-                    try:
-                        error_line = process.stderr.readline()
-                    except (IOError, OSError):
-                        pass
-                        
-                    # If no data was read, sleep briefly to avoid CPU spinning
-                    if not line and not error_line:
-                        time.sleep(0.1)
-                        continue
-                else:
-                    # Unix platforms can use select for non-blocking IO
-                    reads = [process.stdout, process.stderr]
-                    ret = select.select(reads, [], [], 0.1)
-                    
-                    if not ret[0]:
-                        # No data available, try again
+                name, batch = lines.get(timeout=0.5)
+            except queue.Empty:
+                continue
+            
+            if batch is None:
+                open_pipes -= 1
+                continue
+            
+            # Process stderr for errors
+            if name == 'stderr':
+                for raw in batch:
+                    error_text = raw.decode('utf-8', errors='replace').strip()
+                    if not error_text:
                         continue
-                        
-                    # Read from available file descriptors
-                    line = b''
-                    error_line = b''
-                    
-                    if process.stdout in ret[0]:
-                        line = process.stdout.readline()
-                        
-                    if process.stderr in ret[0]:
-                        error_line = process.stderr.readline()
-                
-                # Decode the byte streams
-                line_text = line.decode('utf-8', errors='replace').strip()
-                error_text = error_line.decode('utf-8', errors='replace').strip()
-                
-                if not line_text and not error_text:
-                    continue
-                    
-                # Process stderr for errors
-                if error_text:
                     print(f"STDERR: {error_text}")
                     # Check for specific error messages
                     if "ERROR:" in error_text:
                         self.signals.error.emit(self.url, error_text)
                         return None
+                continue
+            
+            # Process stdout for progress updates
+            try:
+                text = b'\n'.join(batch).decode('utf-8', errors='replace')
                 
-                # Process stdout for progress updates
-                if line_text:
-                    # Look for destination file path
-                    dest_match = re.search(r'\[download\] Destination: (.+)', line_text)
-                    if dest_match:
-                        output_path = dest_match.group(1)
-                        filename = os.path.basename(output_path)
+                # Cheap substring sieve first: most batches of --verbose debug output
+                # can never match and skip the regex entirely
+                if not ('[download]' in text or '[ffmpeg]' in text or ' videos' in text
+                        or 'Deleting original file' in text):
+                    continue
+                
+                # One regex pass over the whole batch; matches come back in line order
+                for match in _YTDLP_LINE_RE.finditer(text):
+                    kind = match.lastgroup
+                    
+                    if kind == 'dest':
+                        # Destination file path
+                        output_file = match.group('dest').strip()
+                        output_name = os.path.basename(output_file)
                         if self.is_playlist and self.total_videos > 1:
-                            self.signals.status_update.emit(f"Downloading [{self.current_video}/{self.total_videos}]: {filename}")
+                            self.signals.status_update.emit(f"Downloading [{self.current_video}/{self.total_videos}]: {output_name}")
                         else:
-                            self.signals.status_update.emit(f"Downloading: {filename}")
-                        output_file = output_path
+                            self.signals.status_update.emit(f"Downloading: {output_name}")
                     
-                    # Look for video count in playlist
-                    playlist_match = re.search(r'Downloading (\d+) videos', line_text)
-                    if playlist_match:
-                        self.total_videos = int(playlist_match.group(1))
+                    elif kind == 'count':
+                        # Video count in playlist
+                        self.total_videos = int(match.group('count'))
                         self.signals.status_update.emit(f"Found {self.total_videos} videos in playlist")
                     
-                    # Look for current video in playlist
-                    video_index_match = re.search(r'\[download\] Downloading video (\d+) of (\d+)', line_text)
-                    if video_index_match:
-                        self.current_video = int(video_index_match.group(1))
-                        self.total_videos = int(video_index_match.group(2))
-                        filename = os.path.basename(output_file or 'video')
-                        self.signals.status_update.emit(f"Downloading [{self.current_video}/{self.total_videos}]: {filename}")
+                    elif kind == 'total':
+                        # Current video in playlist
+                        self.current_video = int(match.group('index'))
+                        self.total_videos = int(match.group('total'))
+                        self.signals.status_update.emit(f"Downloading [{self.current_video}/{self.total_videos}]: {output_name}")
                     
-                    # Look for overall progress percentage
-                    progress_match = re.search(r'\[download\]\s+(\d+\.\d+)%', line_text)
-                    if progress_match:
-                        individual_progress = float(progress_match.group(1))
+                    elif kind == 'pct':
+                        # Overall progress percentage
+                        progress = float(match.group('pct'))
                         # If we're downloading a playlist, calculate overall progress
                         if self.total_videos > 1:
                             # Weight the progress: completed videos + current video progress
-                            overall_progress = ((self.current_video - 1) + (individual_progress / 100)) / self.total_videos * 100
+                            progress = ((self.current_video - 1) + (progress / 100)) / self.total_videos * 100
                             # Cap at 99.9% until completely done
-                            overall_progress = min(overall_progress, 99.9)
-                            self.signals.progress.emit(overall_progress)
-                        else:
-                            self.signals.progress.emit(individual_progress)
+                            progress = min(progress, 99.9)
+                        # Skip changes too small to move the bar
+                        if abs(progress - last_progress) >= 0.5 and self._progress_due():
+                            self.signals.progress.emit(progress)
+                            last_progress = progress
                     
-                    # Look for conversion/processing messages
-                    if "[ffmpeg] Destination:" in line_text:
-                        output_match = re.search(r'\[ffmpeg\] Destination: (.+)', line_text)
-                        if output_match:
-                            output_file = output_match.group(1)
-                            filename = os.path.basename(output_file)
-                            if self.is_playlist and self.total_videos > 1:
-                                self.signals.status_update.emit(f"Converting [{self.current_video}/{self.total_videos}]: {filename}")
-                            else:
-                                self.signals.status_update.emit(f"Converting: {filename}")
+                    elif kind == 'ffdest':
+                        # Conversion/processing messages
+                        output_file = match.group('ffdest').strip()
+                        output_name = os.path.basename(output_file)
+                        if self.is_playlist and self.total_videos > 1:
+                            self.signals.status_update.emit(f"Converting [{self.current_video}/{self.total_videos}]: {output_name}")
+                        else:
+                            self.signals.status_update.emit(f"Converting: {output_name}")
                     
-                    # Look for completion
-                    if "Deleting original file" in line_text:
+                    elif kind == 'deleted':
+                        # Look for completion
                         if self.total_videos == 1 or self.current_video == self.total_videos:
                             # Final file is done
                             self.signals.status_update.emit("Download complete, verifying file...")
@@ -762,34 +1338,23 @@ class YouTubeDownloader(QRunnable):
                 print(f"Error processing youtube-dl output: {str(e)}")
                 # Continue processing despite the error
         
-        # Make sure to drain any remaining output
-        process.communicate()
-        
         # Check if process was cancelled
         if self.is_cancelled:
+            process.terminate()
+            process.wait()
             return None
         
+        process.wait()
+        
         # Verify file exists
         if output_file and os.path.exists(output_file):
             # File exists and process completed
             self.signals.progress.emit(100)
             return output_file
         else:
-            # Look for any downloaded files in the target directory
-            if os.path.isdir(self.output_dir):
-                # Check if any files were created in the last minute
-                recent_files = []
-                one_minute_ago = time.time() - 60
-                
-                for filename in os.listdir(self.output_dir):
-                    filepath = os.path.join(self.output_dir, filename)
-                    if os.path.isfile(filepath) and os.path.getmtime(filepath) > one_minute_ago:
-                        # File was recently created
-                        recent_files.append(filepath)
-            
-            if recent_files:
-                # Return the most recently created file
-                newest_file = max(recent_files, key=os.path.getmtime)
+            # Look for any files created in the target directory in the last minute
+            newest_file = _newest_recent_file(self.output_dir, time.time() - 60)
+            if newest_file:
                 return newest_file
             
             # No file found
@@ -802,27 +1367,27 @@ class YouTubeDownloader(QRunnable):
             self.signals.status_update.emit("yt-dlp not found. Attempting to download it automatically...")
             
             # Create bin directory in the application folder
-            bin_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "bin")
-            os.makedirs(bin_path, exist_ok=True)
+            os.makedirs(_BIN_DIR, exist_ok=True)
             
             # Download the appropriate executable based on platform
             if sys.platform == 'win32':
                 # Windows binary
                 ytdlp_url = "https://github.com/yt-dlp/yt-dlp/releases/latest/download/yt-dlp.exe"
-                ytdlp_path = os.path.join(bin_path, "yt-dlp.exe")
+                ytdlp_path = os.path.join(_BIN_DIR, "yt-dlp.exe")
             else:
                 # Unix binary
                 ytdlp_url = "https://github.com/yt-dlp/yt-dlp/releases/latest/download/yt-dlp"
-                ytdlp_path = os.path.join(bin_path, "yt-dlp")
+                ytdlp_path = os.path.join(_BIN_DIR, "yt-dlp")
             
             self.signals.status_update.emit(f"Downloading yt-dlp from {ytdlp_url}...")
-            urlretrieve(ytdlp_url, ytdlp_path)
+            _fetch(ytdlp_url, ytdlp_path, chunk_size=1 << 20)
             
             # Make executable on Unix systems
             if sys.platform != 'win32':
                 os.chmod(ytdlp_path, 0o755)
             
             if os.path.exists(ytdlp_path):
+                _discover_ytdlp.cache_clear()
                 self.signals.status_update.emit(f"Successfully downloaded yt-dlp to {ytdlp_path}")
                 return ytdlp_path
             
@@ -840,7 +1405,7 @@ class YouTubeDownloader(QRunnable):
             try:
                 from pytube import YouTube, Playlist
             except ImportError:
-                self.signals.error.emit(self.url, "pytube library not found. Please install with: pip install pytube")
+                print("pytube library not found. Install with: pip install pytube")
                 return None
             
             # Ensure output directory exists
@@ -854,37 +1419,35 @@ class YouTubeDownloader(QRunnable):
                     self.total_videos = len(playlist.video_urls)
                     self.signals.status_update.emit(f"Found {self.total_videos} videos in playlist")
                     
+                    # Entries are independent HTTPS fetches, so overlap them; each
+                    # finished download is handed to the convert pool straight away
+                    # so MP3 encodes run on every core while later entries download
                     downloaded_files = []
-                    for i, video_url in enumerate(playlist.video_urls):
-                        if self.is_cancelled:
-                            break
-                        
-                        self.current_video = i + 1
-                        self.signals.status_update.emit(f"Downloading: video {self.current_video} of {self.total_videos}")
-                        
-                        # Download the individual video
-                        try:
-                            yt = YouTube(video_url)
-                            # Calculate progress percentage for the playlist
-                            overall_progress = (i / self.total_videos) * 100
-                            self.signals.progress.emit(min(overall_progress, 99.9))
-                            
-                            # Download audio stream
-                            audio_stream = yt.streams.filter(only_audio=True).first()
-                            # Add numbering to the filename - use bracketed format
-                            base_filename = f"[{i+1:03d}] {self._sanitize_filename(yt.title)}"
-                            output_file = os.path.join(self.output_dir, base_filename)
-                            downloaded_file = audio_stream.download(output_path=self.output_dir, filename=base_filename)
-                            
-                            # Convert to mp3
-                            mp3_file = self._convert_to_mp3(downloaded_file)
-                            if mp3_file:
-                                downloaded_files.append(mp3_file)
-                                
-                        except Exception as e:
-                            print(f"Error downloading video {video_url}: {str(e)}")
-                            # Continue with the next video
-                            continue
+                    total_steps = max(self.total_videos * 2, 1)  # download + convert per entry
+                    finished_steps = 0
+                    downloaded = 0
+                    with ThreadPoolExecutor(max_workers=self.max_parallel) as download_pool, \
+                            ThreadPoolExecutor(max_workers=os.cpu_count() or 1) as convert_pool:
+                        downloads = {
+                            download_pool.submit(self._download_one_pytube, i, video_url)
+                            for i, video_url in enumerate(playlist.video_urls)
+                        }
+                        pending = set(downloads)
+                        while pending:
+                            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                            for future in done:
+                                finished_steps += 1
+                                if future in downloads:
+                                    downloaded += 1
+                                    file_path = future.result()
+                                    if file_path:
+                                        pending.add(convert_pool.submit(self._convert_to_mp3, file_path))
+                                    else:
+                                        finished_steps += 1  # Nothing to convert
+                                    self.signals.status_update.emit(f"Downloaded {downloaded} of {self.total_videos} videos")
+                                elif future.result():
+                                    downloaded_files.append(future.result())
+                            self.signals.progress.emit(min(finished_steps / total_steps * 100, 99.9))
                     
                     if downloaded_files:
                         self.signals.progress.emit(100)
@@ -926,10 +1489,28 @@ class YouTubeDownloader(QRunnable):
             self.signals.error.emit(self.url, f"Error with pytube downloader: {str(e)}")
             return None
         
+    def _download_one_pytube(self, index, video_url):
+        """Download one playlist entry's audio stream with pytube; returns the file or None."""
+        if self.is_cancelled:
+            return None
+        
+        try:
+            from pytube import YouTube
+            yt = YouTube(video_url)
+            
+            # Download audio stream
+            audio_stream = yt.streams.filter(only_audio=True).first()
+            # Add numbering to the filename - use bracketed format
+            base_filename = f"[{index+1:03d}] {self._sanitize_filename(yt.title)}"
+            return audio_stream.download(output_path=self.output_dir, filename=base_filename)
+        except Exception as e:
+            print(f"Error downloading video {video_url}: {str(e)}")
+            return None
+    
     def _sanitize_filename(self, filename):
         """Sanitize filename to be valid on Windows and other platforms."""
         # Remove invalid characters
-        filename = re.sub(r'[\\/*?:"<>|]', '', filename)
+        filename = filename.translate(_SANITIZE_TABLE)
         # Truncate if too long
         if len(filename) > 100:
             filename = filename[:97] + '...'
@@ -940,13 +1521,15 @@ class YouTubeDownloader(QRunnable):
         if not file_path or not os.path.exists(file_path):
             return None
         
+        # Already an MP3 (e.g. yt-dlp extracted it itself) - re-encoding would
+        # only cost time and quality
+        if os.path.splitext(file_path)[1].lower() == '.mp3':
+            return file_path
+        
         try:
             # Get FFmpeg path
-            ffmpeg_path = self.ffmpeg_path
+            ffmpeg_path = self._ffmpeg()
             if not ffmpeg_path:
-                ffmpeg_path = self._get_default_ffmpeg_path()
-            
-            if not ffmpeg_path or not os.path.exists(ffmpeg_path):
                 print("FFmpeg not found, can't convert to MP3")
                 return file_path  # Return original file if we can't convert
             
@@ -954,23 +1537,16 @@ class YouTubeDownloader(QRunnable):
             mp3_path = os.path.splitext(file_path)[0] + '.mp3'
             
             # Run FFmpeg command
-            ffmpeg_cmd = [
-                ffmpeg_path,
-                '-i', file_path,
-                '-vn',  # No video
-                '-ar', '44100',  # Audio sampling rate
-                '-ac', '2',  # Stereo
-                '-b:a', '192k',  # Bitrate
-                '-f', 'mp3',  # Format
-                mp3_path
-            ]
+            ffmpeg_cmd = [ffmpeg_path, '-i', file_path, *_MP3_ENCODE_ARGS, mp3_path]
             
-            process = subprocess.Popen(
+            # Output is never read, so don't pipe it: a full stderr pipe would stall FFmpeg
+            subprocess.run(
                 ffmpeg_cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                check=False,
+                **_SPAWN_KWARGS
             )
-            process.wait()
             
             # Delete original file if conversion successful
             if os.path.exists(mp3_path):
@@ -989,6 +1565,10 @@ class YouTubeDownloader(QRunnable):
     def _ytdl_progress_hook(self, d):
         """Progress hook for ytdl module."""
         if d['status'] == 'downloading':
+            # yt-dlp calls this for every received block; drop ticks the UI can't show
+            if not self._progress_due():
+                return
+            
             # Update progress
             total_bytes = d.get('total_bytes')
             downloaded_bytes = d.get('downloaded_bytes')
@@ -1024,4 +1604,17 @@ def download_from_youtube(url: str, output_dir: str, filename: Optional[str] = N
         Configured YouTubeDownloader instance
     """
     downloader = YouTubeDownloader(url, output_dir, filename, ffmpeg_path, is_playlist)
-    return downloader 
\ No newline at end of file
+    return downloader 
+
+
+# Downloads beyond this many wait in the pool's queue instead of each getting
+# its own thread and yt-dlp process
+MAX_CONCURRENT_DOWNLOADS = min(os.cpu_count() or 1, 4)
+
+
+@functools.lru_cache(maxsize=1)
+def download_pool() -> QThreadPool:
+    """Return the shared thread pool all YouTube downloads run on."""
+    pool = QThreadPool()
+    pool.setMaxThreadCount(MAX_CONCURRENT_DOWNLOADS)
+    return pool
@@ -5,7 +5,8 @@ Run this script once to create the necessary icon files
 """
 
 import os
-from PyQt5.QtGui import QPixmap, QPainter, QColor, QPen, QBrush
+from concurrent.futures import ThreadPoolExecutor
+from PyQt5.QtGui import QImage, QPainter, QColor, QPen, QBrush
 from PyQt5.QtCore import Qt, QRect, QSize
 
 def create_dir_if_not_exists(path):
@@ -16,14 +17,27 @@ def create_dir_if_not_exists(path):
     except Exception as e:
         print(f"Error creating directory {path}: {e}")
 
-def create_icon(name, draw_function, directory):
-    """Create an icon file using the provided drawing function"""
+def save_icon(image, filepath):
+    """Write a rendered icon to disk as PNG"""
+    success = image.save(filepath, "PNG")
+    if success:
+        print(f"Created icon: {filepath}")
+    else:
+        print(f"Failed to create icon: {filepath}")
+
+def create_icon(name, draw_function, directory, executor):
+    """Create an icon file using the provided drawing function
+    
+    Painting happens on the calling thread; the PNG encode and write are
+    handed to the executor so several icons compress at once.
+    """
     filepath = os.path.join(directory, f"{name}.png")
     
-    pixmap = QPixmap(64, 64)
-    pixmap.fill(Qt.GlobalColor.transparent)
+    # QImage (unlike QPixmap) may be used from worker threads
+    image = QImage(64, 64, QImage.Format.Format_ARGB32_Premultiplied)
+    image.fill(Qt.GlobalColor.transparent)
     
-    painter = QPainter(pixmap)
+    painter = QPainter(image)
     painter.setRenderHint(QPainter.RenderHint.Antialiasing, True)
     
     # Call the drawing function
@@ -31,12 +45,8 @@ def create_icon(name, draw_function, directory):
     
     painter.end()
     
-    # Save the pixmap
-    success = pixmap.save(filepath, "PNG")
-    if success:
-        print(f"Created icon: {filepath}")
-    else:
-        print(f"Failed to create icon: {filepath}")
+    # Save the image in the background
+    return executor.submit(save_icon, image, filepath)
 
 def draw_play(painter):
     """Draw a play button triangle"""
@@ -163,15 +173,20 @@ def main():
     create_dir_if_not_exists(icon_dir)
     
     # Create all the icons
-    create_icon("play", draw_play, icon_dir)
-    create_icon("pause", draw_pause, icon_dir)
-    create_icon("next", draw_next, icon_dir)
-    create_icon("previous", draw_previous, icon_dir)
-    create_icon("music_note", draw_music_note, icon_dir)
-    create_icon("volume_low", draw_volume_low, icon_dir)
-    create_icon("volume_medium", draw_volume_medium, icon_dir)
-    create_icon("volume_high", draw_volume_high, icon_dir)
-    create_icon("volume_mute", draw_volume_mute, icon_dir)
+    icons = [
+        ("play", draw_play),
+        ("pause", draw_pause),
+        ("next", draw_next),
+        ("previous", draw_previous),
+        ("music_note", draw_music_note),
+        ("volume_low", draw_volume_low),
+        ("volume_medium", draw_volume_medium),
+        ("volume_high", draw_volume_high),
+        ("volume_mute", draw_volume_mute),
+    ]
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        for name, draw_function in icons:
+            create_icon(name, draw_function, icon_dir, executor)
     
     print("Icon creation complete!")
 
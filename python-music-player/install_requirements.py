@@ -4,6 +4,7 @@
 import subprocess
 import sys
 import os
+import shutil
 import platform
 
 def check_python_version():
@@ -27,6 +28,16 @@ def install_package(package):
         print(f"Failed to install {package}")
         return False
 
+def install_packages(packages):
+    """Install several packages with a single pip run"""
+    print(f"Installing {', '.join(packages)}...")
+    try:
+        subprocess.check_call([sys.executable, "-m", "pip", "install", *packages])
+        return True
+    except subprocess.CalledProcessError:
+        print("Combined install failed, installing packages one at a time...")
+        return False
+
 def install_yt_dlp():
     """Install yt-dlp for YouTube downloading"""
     return install_package("yt-dlp")
@@ -39,26 +50,30 @@ def install_mutagen():
     """Install mutagen for media tag handling"""
     return install_package("mutagen")
 
-def check_ffmpeg():
-    """Check if FFmpeg is installed"""
+def check_ffmpeg(verify=False):
+    """Check if FFmpeg is installed
+    
+    A PATH lookup is enough to answer that; pass verify=True to also launch
+    `ffmpeg -version` and make sure the binary actually runs.
+    """
     print("Checking for FFmpeg...")
-    try:
-        # Try to run ffmpeg -version to see if it's installed
+    ffmpeg_path = shutil.which("ffmpeg")
+    if not ffmpeg_path:
+        print("FFmpeg is not installed or not in PATH.")
+        return False
+    
+    if verify:
         result = subprocess.run(
-            ["ffmpeg", "-version"], 
-            stdout=subprocess.PIPE, 
-            stderr=subprocess.PIPE,
-            text=True
+            [ffmpeg_path, "-version"], 
+            stdout=subprocess.DEVNULL, 
+            stderr=subprocess.DEVNULL
         )
-        if result.returncode == 0:
-            print("FFmpeg is installed.")
-            return True
-        else:
+        if result.returncode != 0:
             print("FFmpeg command failed.")
             return False
-    except FileNotFoundError:
-        print("FFmpeg is not installed or not in PATH.")
-        return False
+    
+    print("FFmpeg is installed.")
+    return True
 
 def install_ffmpeg_instructions():
     """Provide instructions for installing FFmpeg"""
@@ -113,11 +128,14 @@ def main():
     
     print("Installing required packages...\n")
     
-    # Install dependencies
-    success = True
-    success = install_pyside6() and success
-    success = install_mutagen() and success
-    success = install_yt_dlp() and success
+    # Install dependencies in one pip run (resolver and index lookups happen
+    # once); fall back to per-package installs to report which one failed
+    success = install_packages(["PySide6", "mutagen", "yt-dlp"])
+    if not success:
+        success = True
+        success = install_pyside6() and success
+        success = install_mutagen() and success
+        success = install_yt_dlp() and success
     
     # Check for FFmpeg
     ffmpeg_installed = check_ffmpeg()
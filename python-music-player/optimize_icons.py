@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+"""
+Recompress the PNG icons in assets/icons for a release build.
+Requires oxipng on PATH (https://github.com/shssoichiro/oxipng).
+"""
+import os
+import shutil
+import subprocess
+import sys
+
+icons_dir = os.path.join('assets', 'icons')
+
+def main():
+    oxipng = shutil.which('oxipng')
+    if not oxipng:
+        print("Error: oxipng is required to optimize icons but was not found on PATH.")
+        print("Install it, then run this script again:")
+        print("  cargo install oxipng")
+        print("  brew install oxipng          (macOS)")
+        print("  scoop install oxipng         (Windows)")
+        print("  or download a release from https://github.com/shssoichiro/oxipng/releases")
+        sys.exit(1)
+
+    with os.scandir(icons_dir) as it:
+        icons = [entry.path for entry in it if entry.is_file() and entry.name.endswith('.png')]
+    if not icons:
+        print(f"No PNG icons found in {icons_dir}")
+        return
+
+    # One oxipng run handles the whole set and parallelizes internally
+    result = subprocess.run([oxipng, '-o', '4', '--strip', 'safe', *icons])
+    if result.returncode != 0:
+        print(f"oxipng failed with exit code {result.returncode}")
+        sys.exit(result.returncode)
+    print(f"Optimized {len(icons)} icons")
+
+if __name__ == "__main__":
+    main()
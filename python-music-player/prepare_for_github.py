@@ -9,12 +9,9 @@ This script:
 import os
 import shutil
 
-def main():
-    print("Preparing YTune repository for GitHub...")
-    
-    # Create .gitignore file
-    gitignore_content = """
-# Python
+# Written verbatim, so keep it free of leading/trailing blank lines and
+# duplicate patterns (build/ and dist/ also cover PyInstaller output)
+GITIGNORE = b"""# Python
 __pycache__/
 *.py[cod]
 *$py.class
@@ -44,11 +41,6 @@ ENV/
 env.bak/
 venv.bak/
 .venv
-.venv/
-
-# PyInstaller
-dist/
-build/
 
 # SQLite database files
 *.db
@@ -56,7 +48,6 @@ build/
 *.sqlite3
 
 # Local development settings
-.env
 .vscode/
 .idea/
 
@@ -67,11 +58,14 @@ build/
 .Spotlight-V100
 .Trashes
 ehthumbs.db
-Thumbs.db
-"""
+Thumbs.db"""
+
+def main():
+    print("Preparing YTune repository for GitHub...")
     
-    with open(".gitignore", "w") as f:
-        f.write(gitignore_content.strip())
+    # Create .gitignore file
+    with open(".gitignore", "wb") as f:
+        f.write(GITIGNORE)
     
     print("Created .gitignore file")
     
@@ -82,16 +76,24 @@ Thumbs.db
         "bin"
     ]
     
+    # Snapshot the top level once instead of stat-ing each path
+    with os.scandir('.') as it:
+        entries = list(it)
+    top_dirs = {entry.name for entry in entries if entry.is_dir()}
+    top_files = {entry.name for entry in entries if entry.is_file()}
+    
     for directory in dirs_to_create:
-        if not os.path.exists(directory):
-            os.makedirs(directory, exist_ok=True)
-            print(f"Created directory: {directory}")
+        root, _, rest = directory.partition("/")
+        if root in top_dirs and (not rest or os.path.isdir(directory)):
+            continue
+        os.makedirs(directory, exist_ok=True)
+        print(f"Created directory: {directory}")
     
     # Make sure all necessary files exist
-    if not os.path.exists("README.md"):
+    if "README.md" not in top_files:
         print("WARNING: README.md does not exist!")
     
-    if not os.path.exists("LICENSE"):
+    if "LICENSE" not in top_files:
         print("WARNING: LICENSE file does not exist!")
     
     print("\nRepository is now ready for GitHub!")
@@ -1,35 +1,67 @@
 from PIL import Image
 import os
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
 
 # Define file paths
 icons_dir = os.path.join('assets', 'icons')
-input_file = os.path.join(icons_dir, 'next (1).png')
-output_file = os.path.join(icons_dir, 'next1.png')
-
-# Make sure the input file exists
-if not os.path.isfile(input_file):
-    print(f"Input file not found: {input_file}")
-    # List the files in the directory
-    print(f"Files in {icons_dir}:")
+
+# Downloaded copies such as "next (1).png" are flipped into "next1.png"
+_SOURCE_RE = re.compile(r'^(?P<stem>.+) \((?P<n>\d+)\)\.png$')
+
+# Pillow < 9.1 only has the module-level constant
+_ROTATE_180 = getattr(Image, 'Transpose', Image).ROTATE_180
+
+
+def output_path_for(path):
+    """Return where the rotated copy of path is written."""
+    match = _SOURCE_RE.match(os.path.basename(path))
+    return os.path.join(os.path.dirname(path), f"{match['stem']}{match['n']}.png")
+
+
+def rotate_one(path):
+    """Rotate one icon by 180 degrees and save it next to the original."""
+    output_file = output_path_for(path)
+    with Image.open(path) as img:
+        print(f"Opened image: {path}")
+
+        # Rotate the image 180 degrees (a straight pixel reorder, no resampling)
+        rotated_img = img.transpose(_ROTATE_180)
+
+        # Save the rotated image with cheap compression; optimize_icons.py
+        # recompresses the icon set for releases
+        rotated_img.save(output_file, format='PNG', optimize=False, compress_level=1)
+    print(f"Saved rotated image to: {output_file}")
+    return output_file
+
+
+def main():
+    # Find every candidate in one directory pass
     try:
-        for file in os.listdir(icons_dir):
-            print(f"  - {file}")
+        with os.scandir(icons_dir) as it:
+            entries = [entry for entry in it if entry.is_file()]
     except Exception as e:
         print(f"Error listing directory: {e}")
-    exit(1)
-
-# Open the original image
-try:
-    img = Image.open(input_file)
-    print(f"Opened image: {input_file}")
-
-    # Rotate the image 180 degrees
-    rotated_img = img.rotate(180)
-    
-    # Save the rotated image
-    rotated_img.save(output_file)
-    print(f"Saved rotated image to: {output_file}")
-    
-    print("Image rotation complete!")
-except Exception as e:
-    print(f"Error: {e}") 
\ No newline at end of file
+        sys.exit(1)
+
+    targets = [entry.path for entry in entries
+               if 'next' in entry.name and _SOURCE_RE.match(entry.name)]
+    if not targets:
+        print(f"No input files found in {icons_dir}")
+        # List the files in the directory
+        print(f"Files in {icons_dir}:")
+        for entry in entries:
+            print(f"  - {entry.name}")
+        sys.exit(1)
+
+    try:
+        with ProcessPoolExecutor() as executor:
+            list(executor.map(rotate_one, targets))
+        print("Image rotation complete!")
+    except Exception as e:
+        print(f"Error: {e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,30 +1,100 @@
 from setuptools import setup, find_packages
+from setuptools.command.install import install
+from setuptools.command.sdist import sdist
+import json
 import os
+import pathlib
 import sys
 
-# Include additional data files
+_PACKAGES_CACHE = '.packages.cache'
+_DATA_FILES_MODULE = '_data_files.py'
+
+
+class CompileInstall(install):
+    """Install, then byte-compile the installed modules so the first launch skips parsing."""
+
+    def run(self):
+        super().run()
+        import compileall
+        # A list of levels needs Python 3.9; python_requires still allows 3.8
+        if sys.version_info >= (3, 9):
+            compileall.compile_dir(self.install_lib, optimize=[0, 1, 2], workers=0, quiet=1)
+        else:
+            for level in (0, 1, 2):
+                compileall.compile_dir(self.install_lib, optimize=level, workers=0, quiet=1)
+
+
+# Include additional data files: install dir -> filter on the source file name
+_DATA_DIRS = {
+    'assets/icons': lambda name: True,
+    'assets': lambda name: name.endswith('.qss'),
+    'bin': lambda name: True,  # External binaries (ffmpeg, etc.)
+}
+
 def get_data_files():
-    # Assets directory
+    # One scandir per source directory, dispatching on the directory
     data_files = []
-    
-    # Add icon files
-    icons_dir = os.path.join('assets', 'icons')
-    icons = [os.path.join(icons_dir, f) for f in os.listdir(icons_dir) if os.path.isfile(os.path.join(icons_dir, f))]
-    data_files.append(('assets/icons', icons))
-    
-    # Add style files
-    style_files = [os.path.join('assets', f) for f in os.listdir('assets') if f.endswith('.qss')]
-    if style_files:
-        data_files.append(('assets', style_files))
-    
-    # Add external binaries (ffmpeg, etc.)
-    if os.path.exists('bin'):
-        bin_files = [os.path.join('bin', f) for f in os.listdir('bin') if os.path.isfile(os.path.join('bin', f))]
-        if bin_files:
-            data_files.append(('bin', bin_files))
-    
+    for directory, wanted in _DATA_DIRS.items():
+        try:
+            with os.scandir(directory) as it:
+                files = [entry.path for entry in it if entry.is_file() and wanted(entry.name)]
+        except FileNotFoundError:
+            continue
+        if files:
+            data_files.append((directory, files))
     return data_files
 
+def _package_dirs_key(packages):
+    # A new subpackage changes the mtime of its parent, which is either the
+    # root or an already-known package directory
+    dirs = ['.'] + [pkg.replace('.', os.sep) for pkg in packages]
+    return [os.stat(d).st_mtime_ns for d in dirs]
+
+def cached_find_packages():
+    """find_packages(), reusing the last result while the package dirs are unchanged."""
+    try:
+        with open(_PACKAGES_CACHE, 'r', encoding='utf-8') as f:
+            cached = json.load(f)
+        if cached['key'] == _package_dirs_key(cached['packages']):
+            return cached['packages']
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+
+    packages = find_packages()
+    try:
+        with open(_PACKAGES_CACHE, 'w', encoding='utf-8') as f:
+            json.dump({'key': _package_dirs_key(packages), 'packages': packages}, f)
+    except OSError as e:
+        print(f"Could not cache package list: {e}")
+    return packages
+
+def _long_desc():
+    return pathlib.Path(__file__).with_name('README.md').read_text(encoding='utf-8')
+
+def freeze_data_files():
+    """Write the current data_files list to _data_files.py for the sdist."""
+    with open(_DATA_FILES_MODULE, 'w', encoding='utf-8') as f:
+        f.write("# Generated by setup.py sdist; do not edit.\n")
+        f.write(f"_data_files = {get_data_files()!r}\n")
+
+class FreezeSdist(sdist):
+    """sdist that ships a precomputed data_files list, so installs skip the scan."""
+
+    def run(self):
+        freeze_data_files()
+        super().run()
+
+# Only an unpacked sdist (which has PKG-INFO) can trust the frozen list; in a
+# checkout it could be stale
+DATA_FILES = None
+if os.path.exists('PKG-INFO'):
+    try:
+        from _data_files import _data_files as DATA_FILES
+    except ImportError:
+        pass
+if DATA_FILES is None:
+    DATA_FILES = get_data_files()
+
 # Main setup configuration
 setup(
     name="YTune",
@@ -32,12 +102,12 @@ setup(
     author="YTune Team",
     author_email="olerblaine@gmail.com",
     description="A modern music player built with Python and PySide6",
-    long_description=open("README.md").read(),
+    long_description=_long_desc(),
     long_description_content_type="text/markdown",
     url="https://github.com/Bowling220/ytune",
-    packages=find_packages(),
+    packages=cached_find_packages(),
     include_package_data=True,
-    data_files=get_data_files(),
+    data_files=DATA_FILES,
     install_requires=[
         "PySide6>=6.4.0",
         "mutagen>=1.45.0",  # For audio metadata
@@ -47,7 +117,7 @@ setup(
     ],
     entry_points={
         "console_scripts": [
-            "ytune=main:main",
+            "ytune=ytune.app:main",
         ],
     },
     classifiers=[
@@ -59,4 +129,5 @@ setup(
         "Topic :: Multimedia :: Sound/Audio :: Players",
     ],
     python_requires=">=3.8",
+    cmdclass={"install": CompileInstall, "sdist": FreezeSdist},
 ) 
\ No newline at end of file
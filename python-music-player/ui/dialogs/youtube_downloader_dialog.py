@@ -2,16 +2,37 @@
 # -*- coding: utf-8 -*-
 
 import os
+import functools
+import logging
 from PySide6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, 
     QPushButton, QProgressBar, QMessageBox, QFileDialog,
     QCheckBox
 )
-from PySide6.QtCore import Qt, QThreadPool, QSettings
+from PySide6.QtCore import Qt, QSettings, QTimer
 from PySide6.QtWidgets import QApplication
 import re
 
-from core.youtube_downloader import download_from_youtube
+from core.youtube_downloader import download_from_youtube, download_pool
+
+# No handler of our own: until the app configures logging, warnings reach
+# stderr through logging's last-resort handler
+log = logging.getLogger(__name__)
+
+
+# Status text patterns, checked on every status signal
+_TRACK_INFO_RE = re.compile(r'Downloading: (.*?) \((\d+)/(\d+)\)')
+_TRACK_SHORT_RE = re.compile(r'Track (\d+) of (\d+)')
+
+
+@functools.lru_cache(maxsize=1)
+def _dialog_settings() -> QSettings:
+    """Settings store shared by every dialog instance.
+
+    QSettings keeps read values in memory, so reopening the dialog reads them
+    from this object instead of the backing file or registry.
+    """
+    return QSettings("MyCompany", "PythonMusicPlayer")
 
 
 class YouTubeDownloaderDialog(QDialog):
@@ -20,16 +41,37 @@ class YouTubeDownloaderDialog(QDialog):
     def __init__(self, parent=None):
         super().__init__(parent)
         
-        self.settings = QSettings("MyCompany", "PythonMusicPlayer")
+        self.settings = _dialog_settings()
         self.music_dir = self.settings.value("musicDirectory", "")
         self.ffmpeg_path = self.settings.value("ffmpegLocation", "")
         
+        self.downloader = None
+        self._validated_dir = None  # Output directory already known to exist
+        
+        # Compact-view state, saved when minimizing and restored on expand
+        self.is_minimized = False
+        self.original_size = None
+        self.original_pos = None
+        self.original_flags = None
+        self.hidden_widgets = []
+        
+        # Primary screen's available area, cached until the screen setup changes
+        self._screen_rect = None
+        self._watched_screen = None
+        QApplication.instance().primaryScreenChanged.connect(self._reset_screen_rect)
+        
         self.setWindowTitle("Download from YouTube")
         self.setMinimumWidth(500)
         self.setup_ui()
         
-        self.downloader = None
-        self.thread_pool = QThreadPool()
+        self.thread_pool = download_pool()
+        
+        # Last values shown, so repeated signals don't re-render the same state
+        self._last_pct = -1
+        self._last_status = None
+        self._last_counter_key = None  # (track, total) shown in the counter, None when blank
+        self._pending_pct = None  # Newest progress not yet shown; None once a download ends
+        self._progress_flush_scheduled = False
         
     def setup_ui(self):
         """Set up the dialog UI."""
@@ -40,6 +82,7 @@ class YouTubeDownloaderDialog(QDialog):
         title_bar = QHBoxLayout()
         title_label = QLabel("Download from YouTube")
         title_label.setStyleSheet("font-weight: bold; font-size: 14px;")
+        self._title_label = title_label
         self.minimize_btn = QPushButton("Minimize")
         self.minimize_btn.setToolTip("Minimize to a small floating window")
         self.minimize_btn.clicked.connect(self.toggle_minimize)
@@ -48,11 +91,6 @@ class YouTubeDownloaderDialog(QDialog):
         title_bar.addWidget(self.minimize_btn)
         layout.addLayout(title_bar)
         
-        # Store original size
-        self.is_minimized = False
-        self.original_size = None
-        self.original_flags = None
-        
         # URL Input
         url_layout = QVBoxLayout()
         url_label = QLabel("Enter YouTube URL:")
@@ -126,6 +164,8 @@ class YouTubeDownloaderDialog(QDialog):
         self.progress_bar = QProgressBar()
         self.progress_bar.setRange(0, 100)
         self.progress_bar.setValue(0)
+        # No "%p%" text layout on every tick; the fill and track counter show progress
+        self.progress_bar.setTextVisible(False)
         
         # Add track counter for playlists
         track_counter_layout = QHBoxLayout()
@@ -158,6 +198,17 @@ class YouTubeDownloaderDialog(QDialog):
         button_layout.addWidget(close_btn)
         
         layout.addLayout(button_layout)
+        
+        # The layout is fixed, so the compact view hides the same widgets every time
+        self._minimize_hide_widgets = [
+            url_label, self.url_input,
+            self.playlist_checkbox, auto_detect_btn,
+            filename_label, self.filename_input,
+            dir_label, self.dir_input, browse_btn,
+            ffmpeg_label, self.ffmpeg_input, ffmpeg_browse_btn,
+            self.save_ffmpeg_cb,
+            self.download_btn, self.cancel_btn, close_btn,
+        ]
     
     def browse_directory(self):
         """Open a directory browser dialog."""
@@ -168,6 +219,7 @@ class YouTubeDownloaderDialog(QDialog):
         )
         if dir_path:
             self.dir_input.setText(dir_path)
+            self._validated_dir = None
     
     def browse_ffmpeg(self):
         """Open a file browser dialog to select FFmpeg executable."""
@@ -231,21 +283,26 @@ class YouTubeDownloaderDialog(QDialog):
             QMessageBox.warning(self, "Error", "Please select a save directory.")
             return
         
-        if not os.path.isdir(output_dir):
-            try:
-                os.makedirs(output_dir, exist_ok=True)
-            except Exception as e:
-                QMessageBox.critical(self, "Error", f"Could not create directory: {str(e)}")
-                return
+        if output_dir != self._validated_dir:
+            if not os.path.isdir(output_dir):
+                try:
+                    os.makedirs(output_dir, exist_ok=True)
+                except Exception as e:
+                    QMessageBox.critical(self, "Error", f"Could not create directory: {str(e)}")
+                    return
+            self._validated_dir = output_dir
         
         # Get FFmpeg path
         ffmpeg_path = self.ffmpeg_input.text().strip() or None
         
-        # Save FFmpeg path if checkbox is checked
-        if self.save_ffmpeg_cb.isChecked() and ffmpeg_path:
-            self.settings.setValue("ffmpegLocation", ffmpeg_path)
-        elif not self.save_ffmpeg_cb.isChecked():
+        # Save FFmpeg path if checkbox is checked; only touch the store when it changes
+        if self.save_ffmpeg_cb.isChecked():
+            if ffmpeg_path and ffmpeg_path != self.ffmpeg_path:
+                self.settings.setValue("ffmpegLocation", ffmpeg_path)
+                self.ffmpeg_path = ffmpeg_path
+        elif self.ffmpeg_path:
             self.settings.remove("ffmpegLocation")
+            self.ffmpeg_path = ""
         
         filename = self.filename_input.text().strip() or None
         is_playlist = self.playlist_checkbox.isChecked()
@@ -261,7 +318,7 @@ class YouTubeDownloaderDialog(QDialog):
         
         # Connect signals
         self.downloader.signals.started.connect(self.on_download_started)
-        self.downloader.signals.progress.connect(self.on_download_progress)
+        self.downloader.signals.progress.connect(self.on_download_progress, Qt.QueuedConnection)
         self.downloader.signals.status_update.connect(self.on_status_update)
         self.downloader.signals.finished.connect(self.on_download_finished)
         self.downloader.signals.error.connect(self.on_download_error)
@@ -288,15 +345,36 @@ class YouTubeDownloaderDialog(QDialog):
         """Handle download start."""
         self.status_label.setText(f"Download started: {url}")
         self.progress_bar.setValue(0)
+        self._last_pct = 0
+        self._pending_pct = None
+        self._last_status = None
+        self._last_counter_key = None
+        self.track_counter_label.setText("")
     
     def on_download_progress(self, progress):
+        """Record the newest progress; a backlog of queued signals collapses into one repaint."""
+        self._pending_pct = int(progress)
+        if not self._progress_flush_scheduled:
+            self._progress_flush_scheduled = True
+            QTimer.singleShot(0, self._flush_progress)
+    
+    def _flush_progress(self):
         """Update progress bar."""
-        self.progress_bar.setValue(int(progress))
+        self._progress_flush_scheduled = False
+        pct = self._pending_pct
+        if pct is None or pct == self._last_pct:
+            return
+        self._last_pct = pct
+        self.progress_bar.setValue(pct)
     
     def on_status_update(self, status):
         """Update status label."""
+        if status == self._last_status:
+            return
+        self._last_status = status
+        
         # Look for track number information and enhance the status display
-        track_info_match = re.search(r'Downloading: (.*?) \((\d+)/(\d+)\)', status)
+        track_info_match = _TRACK_INFO_RE.search(status)
         
         if track_info_match:
             # We have track numbering information, make it more visible
@@ -307,14 +385,22 @@ class YouTubeDownloaderDialog(QDialog):
             # Format status to prominently show the track numbers
             enhanced_status = f"Track {current_track} of {total_tracks}: {filename}"
             self.status_label.setText(enhanced_status)
-            
-            # Update the track counter with percentage
-            completion_pct = round((current_track / total_tracks) * 100)
-            self.track_counter_label.setText(f"Track {current_track}/{total_tracks} ({completion_pct}% complete)")
+            counter_key = (current_track, total_tracks)
         else:
             # Regular status update
             self.status_label.setText(status)
-            self.track_counter_label.setText("")
+            counter_key = None
+        
+        # The counter only changes when the track does, not on every status line
+        if counter_key != self._last_counter_key:
+            self._last_counter_key = counter_key
+            if counter_key is None:
+                self.track_counter_label.setText("")
+            else:
+                # Update the track counter with percentage
+                current_track, total_tracks = counter_key
+                completion_pct = round((current_track / total_tracks) * 100)
+                self.track_counter_label.setText(f"Track {current_track}/{total_tracks} ({completion_pct}% complete)")
         
         # Update title if minimized
         if self.is_minimized:
@@ -325,44 +411,26 @@ class YouTubeDownloaderDialog(QDialog):
         if not self.is_minimized:
             return
         
-        try:
-            # Safely get the title label
-            title_layout = self.layout().itemAt(0)
-            if not title_layout or not title_layout.layout():
-                return
-            
-            title_item = title_layout.layout().itemAt(0)
-            if not title_item or not title_item.widget():
-                return
-            
-            title_label = title_item.widget()
-            
-            # Get status text safely
-            if not hasattr(self, 'status_label') or not self.status_label:
-                return
-            
-            status_text = self.status_label.text()
-            
-            # Look for track numbering in the status text
-            track_info_match = re.search(r'Track (\d+) of (\d+)', status_text)
-            if track_info_match:
-                current_track = track_info_match.group(1)
-                total_tracks = track_info_match.group(2)
-                # Create a more compact title with just the track numbers
-                title_label.setText(f"YouTube Downloader - Track {current_track}/{total_tracks}")
-                return
-            
-            # Truncate if too long
-            if len(status_text) > 40:
-                status_text = status_text[:37] + "..."
-            
-            title_label.setText("YouTube Downloader - " + status_text)
-        except Exception as e:
-            print(f"Error updating minimized title: {e}")
-            # Don't let title update errors crash the application
+        status_text = self.status_label.text()
+        
+        # Look for track numbering in the status text
+        track_info_match = _TRACK_SHORT_RE.search(status_text)
+        if track_info_match:
+            current_track = track_info_match.group(1)
+            total_tracks = track_info_match.group(2)
+            # Create a more compact title with just the track numbers
+            self._title_label.setText(f"YouTube Downloader - Track {current_track}/{total_tracks}")
+            return
+        
+        # Truncate if too long
+        if len(status_text) > 40:
+            status_text = status_text[:37] + "..."
+        
+        self._title_label.setText("YouTube Downloader - " + status_text)
     
     def on_download_finished(self, url, file_path):
         """Handle download completion."""
+        self._pending_pct = None
         self.download_btn.setEnabled(True)
         self.cancel_btn.setEnabled(False)
         self.url_input.setEnabled(True)
@@ -373,9 +441,10 @@ class YouTubeDownloaderDialog(QDialog):
         self.filename_input.clear()
         self.progress_bar.setValue(100)
         self.track_counter_label.setText("")
+        self._last_counter_key = None
         
-        QMessageBox.information(
-            self,
+        self._show_message(
+            QMessageBox.Information,
             "Download Complete",
             f"Downloaded to:\n{file_path}"
         )
@@ -387,6 +456,7 @@ class YouTubeDownloaderDialog(QDialog):
     
     def on_download_error(self, url, error_message):
         """Handle download errors."""
+        self._pending_pct = None
         self.download_btn.setEnabled(True)
         self.cancel_btn.setEnabled(False)
         self.url_input.setEnabled(True)
@@ -395,11 +465,17 @@ class YouTubeDownloaderDialog(QDialog):
         self.progress_bar.setValue(0)
         self.status_label.setText(f"Error: {error_message}")
         
-        QMessageBox.warning(
-            self,
+        self._show_message(
+            QMessageBox.Warning,
             "Download Error",
             f"Failed to download from {url}:\n{error_message}"
-        ) 
+        )
+    
+    def _show_message(self, icon, title, text):
+        """Show a window-modal message box without blocking in a nested event loop."""
+        box = QMessageBox(icon, title, text, QMessageBox.Ok, self)
+        box.setAttribute(Qt.WA_DeleteOnClose)
+        box.open()
 
     def toggle_minimize(self):
         """Toggle the minimized state of the dialog."""
@@ -408,6 +484,19 @@ class YouTubeDownloaderDialog(QDialog):
         else:
             self.minimize_to_compact_view()
 
+    def _reset_screen_rect(self, *args):
+        self._screen_rect = None
+
+    def _available_geometry(self):
+        """Return the primary screen's available geometry, querying Qt only after a change."""
+        if self._screen_rect is None:
+            screen = QApplication.primaryScreen()
+            if screen is not self._watched_screen:
+                screen.availableGeometryChanged.connect(self._reset_screen_rect)
+                self._watched_screen = screen
+            self._screen_rect = screen.availableGeometry()
+        return self._screen_rect
+
     def minimize_to_compact_view(self):
         """Convert the dialog to a compact floating view."""
         if not self.is_minimized:
@@ -420,86 +509,45 @@ class YouTubeDownloaderDialog(QDialog):
                 # Make a backup of the original window flags
                 self.original_flags = self.windowFlags()
                 
-                # Create a list of elements to keep visible
-                keep_visible = [self.status_label, self.progress_bar, self.track_counter_label]
-                
-                # Store which widgets to hide in a safe way
-                self.hidden_widgets = []
-                for i in range(self.layout().count()):
-                    item = self.layout().itemAt(i)
-                    if not item:
-                        continue
-                        
-                    widget = item.widget()
-                    layout = item.layout()
+                # Batch the changes below into a single relayout and repaint
+                self.setUpdatesEnabled(False)
+                try:
+                    # Hide the input and button rows; only the title bar and progress stay
+                    self.hidden_widgets = [w for w in self._minimize_hide_widgets if w.isVisible()]
+                    for widget in self.hidden_widgets:
+                        widget.setVisible(False)
                     
-                    # Skip the title bar layout
-                    if i == 0:
-                        continue
+                    # Change the button text
+                    self.minimize_btn.setText("Expand")
                     
-                    # If it's a widget, hide it
-                    if widget and widget not in keep_visible:
-                        if widget.isVisible():
-                            self.hidden_widgets.append(widget)
-                            widget.setVisible(False)
-                            
-                    # If it's a layout, check each widget in it
-                    elif layout:
-                        # Check if this layout contains elements we want to keep
-                        contains_important = False
-                        for j in range(layout.count()):
-                            sub_item = layout.itemAt(j)
-                            if not sub_item:
-                                continue
-                                
-                            w = sub_item.widget()
-                            if w in keep_visible:
-                                contains_important = True
-                                break
-                        
-                        if contains_important:
-                            continue
-                            
-                        # Hide all widgets in this layout
-                        for j in range(layout.count()):
-                            sub_item = layout.itemAt(j)
-                            if not sub_item:
-                                continue
-                                
-                            w = sub_item.widget()
-                            if w and w.isVisible():
-                                self.hidden_widgets.append(w)
-                                w.setVisible(False)
-                
-                # Change the button text
-                self.minimize_btn.setText("Expand")
-                
-                # Update the title with download info
-                self.update_minimized_title()
+                    # Update the title with download info
+                    self.update_minimized_title()
+                finally:
+                    self.setUpdatesEnabled(True)
                     
                 # Resize to minimum size
                 self.adjustSize()
                 
                 # Move to bottom right corner of screen, but safely
                 try:
-                    screen_rect = QApplication.primaryScreen().availableGeometry()
+                    screen_rect = self._available_geometry()
                     self.move(screen_rect.width() - self.width() - 20, 
                               screen_rect.height() - self.height() - 20)
-                except Exception as e:
-                    print(f"Error positioning window: {e}")
+                except Exception:
+                    log.warning("Error positioning window", exc_info=True)
                 
                 # Set window flags safely
                 try:
                     new_flags = self.windowFlags() | Qt.WindowStaysOnTopHint
                     self.setWindowFlags(new_flags)
                     self.show()
-                except Exception as e:
-                    print(f"Error setting window flags: {e}")
+                except Exception:
+                    log.warning("Error setting window flags", exc_info=True)
                     # Fallback - just show the window
                     self.show()
                     
-            except Exception as e:
-                print(f"Error in minimize_to_compact_view: {e}")
+            except Exception:
+                log.warning("Error in minimize_to_compact_view", exc_info=True)
                 # Reset minimized state if there was an error
                 self.is_minimized = False
                 self.show()
@@ -508,61 +556,64 @@ class YouTubeDownloaderDialog(QDialog):
         """Restore the dialog from the compact view."""
         if self.is_minimized:
             try:
-                # Restore hidden widgets safely
-                for widget in self.hidden_widgets:
-                    try:
-                        if widget and not widget.isVisible():
-                            widget.setVisible(True)
-                    except Exception as e:
-                        print(f"Error restoring widget: {e}")
-                        
-                self.hidden_widgets = []
-                
-                # Change the button text back
-                self.minimize_btn.setText("Minimize")
-                
-                # Restore title
-                if hasattr(self, 'original_title'):
-                    title_label = self.layout().itemAt(0).layout().itemAt(0).widget()
-                    title_label.setText("Download from YouTube")
+                # Batch the changes below into a single relayout and repaint
+                self.setUpdatesEnabled(False)
+                try:
+                    # Restore hidden widgets safely
+                    for widget in self.hidden_widgets:
+                        try:
+                            if widget and not widget.isVisible():
+                                widget.setVisible(True)
+                        except Exception:
+                            log.warning("Error restoring widget", exc_info=True)
+                            
+                    self.hidden_widgets = []
+                    
+                    # Change the button text back
+                    self.minimize_btn.setText("Minimize")
+                    
+                    # Restore title
+                    self._title_label.setText("Download from YouTube")
+                finally:
+                    self.setUpdatesEnabled(True)
                 
                 # Restore window flags safely
                 try:
-                    if hasattr(self, 'original_flags'):
+                    if self.original_flags is not None:
                         self.setWindowFlags(self.original_flags)
                     else:
                         # Fallback - remove StaysOnTop hint
                         self.setWindowFlags(self.windowFlags() & ~Qt.WindowStaysOnTopHint)
                     self.show()
-                except Exception as e:
-                    print(f"Error restoring window flags: {e}")
+                except Exception:
+                    log.warning("Error restoring window flags", exc_info=True)
                     self.show()
                 
                 # Restore size
-                if hasattr(self, 'original_size') and self.original_size:
+                if self.original_size is not None:
                     try:
                         self.resize(self.original_size)
-                    except Exception as e:
-                        print(f"Error restoring size: {e}")
+                    except Exception:
+                        log.warning("Error restoring size", exc_info=True)
                     
                 # Restore position
-                if hasattr(self, 'original_pos') and self.original_pos:
+                if self.original_pos is not None:
                     try:
                         self.move(self.original_pos)
-                    except Exception as e:
-                        print(f"Error restoring position: {e}")
+                    except Exception:
+                        log.warning("Error restoring position", exc_info=True)
                     
                 self.is_minimized = False
                 
-            except Exception as e:
-                print(f"Error in restore_from_minimized: {e}")
+            except Exception:
+                log.warning("Error in restore_from_minimized", exc_info=True)
                 # Ensure window is visible
                 self.show()
 
     def closeEvent(self, event):
         """Handle close event for the dialog."""
         # Clean up any resources if needed
-        if hasattr(self, 'downloader') and self.downloader:
+        if self.downloader is not None:
             self.downloader.cancel()
         
         # Accept the close event to close the dialog
@@ -577,7 +628,7 @@ def show_youtube_downloader_dialog(parent=None):
         dialog.show()
         return dialog
     except Exception as e:
-        print(f"Error showing YouTube downloader: {e}")
+        log.warning("Error showing YouTube downloader", exc_info=True)
         if parent:
             QMessageBox.warning(parent, "Error", f"Could not open YouTube downloader: {str(e)}")
         return None 
\ No newline at end of file
@@ -1,6 +1,7 @@
 # ui/main_window.py
 import sys
 import os
+import zlib
 from typing import Optional
 from PySide6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QFrame, QSplitter,
@@ -8,8 +9,8 @@ from PySide6.QtWidgets import (
     QProgressBar, QMenu, QMessageBox
 )
 from PySide6 import QtCore
-from PySide6.QtCore import Qt, QSize, QUrl, QSettings, QThreadPool, Slot, QTimer
-from PySide6.QtGui import QIcon, QPixmap, QImageReader, QPainter, QColor, QAction
+from PySide6.QtCore import Qt, QSize, QUrl, QSettings, QThreadPool, Slot, QTimer, QObject, Signal, QRunnable
+from PySide6.QtGui import QIcon, QPixmap, QPixmapCache, QImage, QImageReader, QPainter, QColor, QAction
 from PySide6.QtMultimedia import QMediaPlayer
 
 # Project imports
@@ -21,17 +22,27 @@ from .views.songs_view import SongsView
 from .dialogs.youtube_downloader_dialog import YouTubeDownloaderDialog
 from core.player import Player
 from core.database import Database
-from ui.views.playlist_view import PlaylistView
 from ui.player_controls import PlayerControls
 
+# Scaled album art is kept in the application-wide pixmap cache (limit in KiB)
+QPixmapCache.setCacheLimit(20 * 1024)
+
 # --- Icon Paths --- (Adjust if your structure differs)
 ICON_DIR = os.path.join(os.path.dirname(__file__), '..', 'assets', 'icons')
 def get_icon_path(name):
     return os.path.join(ICON_DIR, name)
 
-def safe_load_icon(icon_path, fallback_color=None):
-    """Safely load an icon with fallback if the file doesn't exist"""
-    pixmap = QPixmap(icon_path)
+def safe_load_icon(icon_path, fallback_color=None, icon_cache=None):
+    """Safely load an icon with fallback if the file doesn't exist.
+
+    icon_cache maps icon basenames to file bytes preloaded at startup.
+    """
+    data = icon_cache.get(os.path.basename(icon_path)) if icon_cache else None
+    if data is not None:
+        pixmap = QPixmap()
+        pixmap.loadFromData(data)
+    else:
+        pixmap = QPixmap(icon_path)
     if not pixmap.isNull():
         return pixmap
         
@@ -56,6 +67,80 @@ def safe_load_icon(icon_path, fallback_color=None):
     
     return temp_pixmap
 
+class IconCache:
+    """Decoded icons shared by the whole window, each loaded once per path.
+
+    Misses go through the preloaded bytes from main() when available, then
+    the file on disk.
+    """
+    _data = {}      # basename -> preloaded file bytes
+    _pixmaps = {}   # (path, fallback_color) -> QPixmap from safe_load_icon()
+    _icons = {}     # path -> QIcon, empty if the file is missing
+    _safe_icons = {}  # path -> QIcon built from pixmap(), with fallback art
+
+    @classmethod
+    def preload(cls, icon_bytes):
+        cls._data.update(icon_bytes or {})
+
+    @classmethod
+    def pixmap(cls, path, fallback_color=None):
+        key = (path, fallback_color)
+        pixmap = cls._pixmaps.get(key)
+        if pixmap is None:
+            pixmap = cls._pixmaps[key] = safe_load_icon(path, fallback_color, cls._data)
+        return pixmap
+
+    @classmethod
+    def safe_icon(cls, path):
+        icon = cls._safe_icons.get(path)
+        if icon is None:
+            icon = cls._safe_icons[path] = QIcon(cls.pixmap(path))
+        return icon
+
+    @classmethod
+    def icon(cls, path):
+        icon = cls._icons.get(path)
+        if icon is None:
+            data = cls._data.get(os.path.basename(path))
+            if data is None:
+                icon = QIcon(path)
+            else:
+                pixmap = QPixmap()
+                pixmap.loadFromData(data)
+                icon = QIcon(pixmap)
+            cls._icons[path] = icon
+        return icon
+
+class AlbumArtSignals(QObject):
+    """Signals for AlbumArtDecoder."""
+    decoded = Signal(int, QImage)  # (request id, scaled art; null if undecodable)
+
+
+class AlbumArtDecoder(QRunnable):
+    """Decode and scale embedded album art off the GUI thread.
+
+    Works on QImage only; the QPixmap is made back on the GUI thread.
+    """
+
+    def __init__(self, request_id, data, size, source=""):
+        super().__init__()
+        self.request_id = request_id
+        self.data = data
+        self.size = size
+        self.source = source
+        self.signals = AlbumArtSignals()
+
+    @Slot()
+    def run(self):
+        image = QImage.fromData(self.data)
+        if image.isNull():
+            print(f"Warning: Could not load album art data for {self.source}")
+        else:
+            image = image.scaled(self.size,
+                                 Qt.AspectRatioMode.KeepAspectRatio,
+                                 Qt.TransformationMode.SmoothTransformation)
+        self.signals.decoded.emit(self.request_id, image)
+
 ICON_PLAY = get_icon_path("play.jpg")
 ICON_PAUSE = get_icon_path("pause.png")
 ICON_NEXT = get_icon_path("next.png")
@@ -81,19 +166,34 @@ SETTINGS_SPLITTER_SIZES = "splitterSizes"
 
 
 class MainWindow(QMainWindow):
-    def __init__(self, parent=None):
+    def __init__(self, parent=None, icon_cache=None):
         super().__init__(parent)
+        IconCache.preload(icon_cache)
         self.settings = QSettings("YTuneTeam", "YTune") # For storing settings
         self.playback_manager = playback.PlaybackManager()
         self.scanner_worker = None
         self.scanner_thread = None # Using QThreadPool now
         self.thread_pool = QThreadPool()
         print(f"Max Threads: {self.thread_pool.maxThreadCount()}")
+        self._views = {}  # Secondary views, built on first navigation
+        self._art_request = 0  # Bumped per track display; stale art decodes are dropped
+        self._art_cache_key = None  # QPixmapCache key for the art being decoded
+        
+        # Player position arrives every few tens of ms; repaint it at most 4x a second
+        self._pending_pos = None
+        self._last_displayed_sec = -1
+        self._last_duration_sec = -1
+        self._pos_timer = QTimer(self)
+        self._pos_timer.setInterval(250)
+        self._pos_timer.timeout.connect(self._flush_pos)
 
         self.is_playing = False
         
         # Create placeholder pixmap for album art
-        self.placeholder_pixmap = safe_load_icon(ICON_MUSIC_NOTE, Qt.GlobalColor.darkGray)
+        self.placeholder_pixmap = IconCache.pixmap(ICON_MUSIC_NOTE, Qt.GlobalColor.darkGray)
+        # Sized to the 85x85 album art label, so it is shown without rescaling
+        self._placeholder_scaled = self.placeholder_pixmap.scaled(
+            85, 85, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
         
         # Create status bar
         self.status_bar = QStatusBar()
@@ -137,6 +237,9 @@ class MainWindow(QMainWindow):
         
         # Auto-detect Bluetooth audio devices on startup
         QTimer.singleShot(1000, self._startup_audio_detection)
+        
+        # Warm the icons swapped on playback state changes
+        IconCache.safe_icon(ICON_PAUSE)
 
     def _setup_components(self):
         """Set up all UI components."""
@@ -170,7 +273,7 @@ class MainWindow(QMainWindow):
         top_button_layout.setSpacing(10)
         
         self.scan_button = QPushButton("Scan")
-        self.scan_button.setIcon(QIcon(ICON_SCAN))
+        self.scan_button.setIcon(IconCache.icon(ICON_SCAN))
         self.scan_button.setIconSize(QSize(16, 16))
         self.scan_button.setToolTip("Scan Library")
         self.scan_button.setObjectName("action_button")
@@ -181,7 +284,7 @@ class MainWindow(QMainWindow):
         self.youtube_button.clicked.connect(self.show_youtube_downloader)
         
         self.settings_button = QPushButton("Settings")
-        self.settings_button.setIcon(QIcon(ICON_SETTINGS))
+        self.settings_button.setIcon(IconCache.icon(ICON_SETTINGS))
         self.settings_button.setIconSize(QSize(16, 16))
         self.settings_button.setToolTip("Settings")
         self.settings_button.setObjectName("action_button")
@@ -204,7 +307,7 @@ class MainWindow(QMainWindow):
         
         for item, icon_path in nav_items.items():
             button = QPushButton(item)
-            button.setIcon(QIcon(icon_path))
+            button.setIcon(IconCache.icon(icon_path))
             button.setIconSize(QSize(20, 20))
             button.setObjectName("nav_button")
             button.setCheckable(True)
@@ -234,15 +337,9 @@ class MainWindow(QMainWindow):
             self.songs_view = SongsView()
             self.songs_view.track_selected.connect(self.on_track_selected)
         
-        if not hasattr(self, 'playlist_view'):
-            from ui.views.playlist_view import PlaylistView
-            self.playlist_view = PlaylistView()
-            self.playlist_view.playlist_selected.connect(self.load_playlist_tracks)
-            self.playlist_view.track_selected.connect(self.on_track_selected)
-
-        # Add views to stacked widget
+        # Add views to stacked widget; the playlist view is added by
+        # _get_playlist_view() the first time it is shown
         self.stacked_widget.addWidget(self.songs_view)
-        self.stacked_widget.addWidget(self.playlist_view)
         # Will add these later:
         # self.stacked_widget.addWidget(self.albums_view)
         # self.stacked_widget.addWidget(self.artists_view)
@@ -274,8 +371,7 @@ class MainWindow(QMainWindow):
             self.album_art_label.setScaledContents(False)
             self.album_art_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
             self.album_art_label.setStyleSheet("#album_art { border-radius: 8px; }")
-            default_art = safe_load_icon(ICON_MUSIC_NOTE, Qt.GlobalColor.darkGray)
-            self.album_art_label.setPixmap(default_art.scaled(85, 85, Qt.AspectRatioMode.KeepAspectRatio))
+            self.album_art_label.setPixmap(self._placeholder_scaled)
             
         pb_left_layout.addWidget(self.album_art_label)
 
@@ -309,21 +405,21 @@ class MainWindow(QMainWindow):
         
         if not hasattr(self, 'prev_button'):
             self.prev_button = QPushButton()
-            self.prev_button.setIcon(QIcon(safe_load_icon(ICON_PREV)))
+            self.prev_button.setIcon(IconCache.safe_icon(ICON_PREV))
             self.prev_button.setObjectName("playback_button")
             self.prev_button.setIconSize(QSize(28, 28))
             self.prev_button.setFixedSize(44, 44)
             
         if not hasattr(self, 'play_pause_button'):
             self.play_pause_button = QPushButton()
-            self.play_pause_button.setIcon(QIcon(safe_load_icon(ICON_PLAY))) # Start with play icon
+            self.play_pause_button.setIcon(IconCache.safe_icon(ICON_PLAY)) # Start with play icon
             self.play_pause_button.setObjectName("play_button")
             self.play_pause_button.setIconSize(QSize(36, 36))  # Larger play button
             self.play_pause_button.setFixedSize(60, 60)
             
         if not hasattr(self, 'next_button'):
             self.next_button = QPushButton()
-            self.next_button.setIcon(QIcon(safe_load_icon(ICON_NEXT)))
+            self.next_button.setIcon(IconCache.safe_icon(ICON_NEXT))
             self.next_button.setObjectName("playback_button")
             self.next_button.setIconSize(QSize(28, 28))
             self.next_button.setFixedSize(44, 44)
@@ -374,6 +470,19 @@ class MainWindow(QMainWindow):
             self.volume_icon_label = QLabel() # Will hold volume icon
             self.volume_icon_label.setFixedSize(24, 24)
             
+        # Scale each volume level's icon once; slider ticks just swap pixmaps
+        self._vol_icons = {
+            bucket: IconCache.pixmap(path).scaled(
+                24, 24, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
+            for bucket, path in (
+                ('mute', ICON_VOLUME_MUTE),
+                ('low', ICON_VOLUME_LOW),
+                ('medium', ICON_VOLUME_MEDIUM),
+                ('high', ICON_VOLUME_HIGH),
+            )
+        }
+        self._last_vol_bucket = None
+            
         volume_layout.addWidget(self.volume_icon_label)
         
         if not hasattr(self, 'volume_slider'):
@@ -422,7 +531,7 @@ class MainWindow(QMainWindow):
         
         # Connect navigation buttons
         self.nav_buttons["Songs"].clicked.connect(lambda: self.stacked_widget.setCurrentWidget(self.songs_view))
-        self.nav_buttons["Playlists"].clicked.connect(lambda: self.stacked_widget.setCurrentWidget(self.playlist_view))
+        self.nav_buttons["Playlists"].clicked.connect(self._show_playlists)
         # self.nav_buttons["Albums"].clicked.connect(lambda: self.stacked_widget.setCurrentWidget(self.albums_view))
         # self.nav_buttons["Artists"].clicked.connect(lambda: self.stacked_widget.setCurrentWidget(self.artists_view))
         
@@ -431,10 +540,6 @@ class MainWindow(QMainWindow):
         self.next_button.clicked.connect(self.on_next_button_clicked)
         self.prev_button.clicked.connect(self.on_prev_button_clicked)
         
-        # Connect playlist-related signals
-        self.playlist_view.playlist_selected.connect(self.load_playlist_tracks)
-        self.playlist_view.track_selected.connect(self.on_track_selected)
-        
         # Connect volume slider
         self.volume_slider.valueChanged.connect(self.on_volume_changed)
         
@@ -460,10 +565,10 @@ class MainWindow(QMainWindow):
 
     def update_play_pause_button(self, state):
         if state == playback.PlaybackState.PLAYING:
-            self.play_pause_button.setIcon(QIcon(safe_load_icon(ICON_PAUSE)))
+            self.play_pause_button.setIcon(IconCache.safe_icon(ICON_PAUSE))
             self.play_pause_button.setToolTip("Pause")
         else: # Paused or Stopped
-            self.play_pause_button.setIcon(QIcon(safe_load_icon(ICON_PLAY)))
+            self.play_pause_button.setIcon(IconCache.safe_icon(ICON_PLAY))
             self.play_pause_button.setToolTip("Play")
 
     def update_track_display(self, track: Optional[Track]):
@@ -471,46 +576,89 @@ class MainWindow(QMainWindow):
             self.track_title_label.setText(track.display_title())
             self.track_artist_label.setText(track.display_artist())
             # Update album art
-            if track.album_art:
-                pixmap = QPixmap()
-                if pixmap.loadFromData(track.album_art):
-                     # Scale pixmap maintaining aspect ratio
-                     scaled_pixmap = pixmap.scaled(self.album_art_label.size(),
-                                                  Qt.AspectRatioMode.KeepAspectRatio,
-                                                  Qt.TransformationMode.SmoothTransformation)
-                     self.album_art_label.setPixmap(scaled_pixmap)
-                else:
-                    print(f"Warning: Could not load album art data for {track.filepath}")
-                    self.album_art_label.setPixmap(self.placeholder_pixmap.scaled(80, 80, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation))
+            self._art_request += 1
+            art_key = None
+            if track.album_art and track.id is not None:
+                size = self.album_art_label.size()
+                # The CRC keys on the art itself, so a rescan that changes the
+                # cover for this track id misses instead of showing the old one
+                art_key = (f"art:{track.id}:{zlib.crc32(track.album_art):08x}:"
+                           f"{size.width()}x{size.height()}")
+            cached_art = QPixmap()
+            if art_key and QPixmapCache.find(art_key, cached_art):
+                self.album_art_label.setPixmap(cached_art)
+            elif track.album_art:
+                self._art_cache_key = art_key
+                # Show the placeholder until the decoded art arrives
+                self.album_art_label.setPixmap(self._placeholder_scaled)
+                decoder = AlbumArtDecoder(self._art_request, track.album_art,
+                                          self.album_art_label.size(), track.filepath)
+                decoder.signals.decoded.connect(self._on_album_art_decoded)
+                self.thread_pool.start(decoder)
 
             else:
-                 self.album_art_label.setPixmap(self.placeholder_pixmap.scaled(80, 80, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation))
+                 self.album_art_label.setPixmap(self._placeholder_scaled)
 
         else: # No track playing
+            self._art_request += 1
+            self._pending_pos = None
+            self._last_displayed_sec = 0
+            self._last_duration_sec = 0
             self.track_title_label.setText("No Track Playing")
             self.track_artist_label.setText("")
-            self.album_art_label.setPixmap(self.placeholder_pixmap.scaled(80, 80, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation))
+            self.album_art_label.setPixmap(self._placeholder_scaled)
             self.progress_slider.setValue(0)
             self.progress_slider.setEnabled(False)
             self.current_time_label.setText("0:00")
             self.total_time_label.setText("0:00")
 
+    @Slot(int, QImage)
+    def _on_album_art_decoded(self, request_id, image):
+        # Drop art for a track that is no longer displayed, and failed decodes
+        # (the placeholder is already showing)
+        if request_id != self._art_request or image.isNull():
+            return
+        pixmap = QPixmap.fromImage(image)
+        if self._art_cache_key:
+            QPixmapCache.insert(self._art_cache_key, pixmap)
+        self.album_art_label.setPixmap(pixmap)
+
     def update_duration_display(self, duration_ms: int):
+        # Label text only depends on whole seconds
+        sec = max(duration_ms, 0) // 1000
         if duration_ms > 0:
             self.progress_slider.setMaximum(duration_ms)
-            self.total_time_label.setText(format_duration_ms(duration_ms))
+            if sec != self._last_duration_sec:
+                self.total_time_label.setText(format_duration_ms(duration_ms))
             self.progress_slider.setEnabled(True)
         else:
             self.progress_slider.setMaximum(0)
-            self.total_time_label.setText("0:00")
+            if sec != self._last_duration_sec:
+                self.total_time_label.setText("0:00")
             self.progress_slider.setEnabled(False)
+        self._last_duration_sec = sec
 
 
     def update_position_display(self, position_ms: int):
+        self._pending_pos = position_ms
+        if not self._pos_timer.isActive():
+            self._pos_timer.start()
+
+    def _flush_pos(self):
+        position_ms = self._pending_pos
+        if position_ms is None:
+            # No new position since the last tick; idle until the next one
+            self._pos_timer.stop()
+            return
+        self._pending_pos = None
         # Only update slider if user isn't dragging it
         if not self.progress_slider.isSliderDown():
             self.progress_slider.setValue(position_ms)
-        self.current_time_label.setText(format_duration_ms(position_ms))
+        # The label only shows whole seconds
+        sec = position_ms // 1000
+        if sec != self._last_displayed_sec:
+            self._last_displayed_sec = sec
+            self.current_time_label.setText(format_duration_ms(position_ms))
 
     def update_volume_display(self, volume=None):
         """Updates volume display based on current volume."""
@@ -519,17 +667,16 @@ class MainWindow(QMainWindow):
         
         # Set the volume icon based on level
         if volume <= 0:
-            self.volume_icon_label.setPixmap(QPixmap(safe_load_icon(ICON_VOLUME_MUTE)).scaled(
-                24, 24, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation))
+            bucket = 'mute'
         elif volume < 30:
-            self.volume_icon_label.setPixmap(QPixmap(safe_load_icon(ICON_VOLUME_LOW)).scaled(
-                24, 24, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation))
+            bucket = 'low'
         elif volume < 70:
-            self.volume_icon_label.setPixmap(QPixmap(safe_load_icon(ICON_VOLUME_MEDIUM)).scaled(
-                24, 24, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation))
+            bucket = 'medium'
         else:
-            self.volume_icon_label.setPixmap(QPixmap(safe_load_icon(ICON_VOLUME_HIGH)).scaled(
-                24, 24, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation))
+            bucket = 'high'
+        if bucket != self._last_vol_bucket:
+            self._last_vol_bucket = bucket
+            self.volume_icon_label.setPixmap(self._vol_icons[bucket])
         
         # Update slider position if it's not the source of the change
         if self.volume_slider.value() != volume:
@@ -549,11 +696,11 @@ class MainWindow(QMainWindow):
             # Get track IDs based on which view is active
             if current_widget == self.songs_view:
                 all_track_ids = self.songs_view.get_all_track_ids_in_order()
-            elif current_widget == self.playlist_view:
+            elif current_widget is not None and current_widget is self._views.get('playlist'):
                 # Get track IDs from current playlist
-                for i in range(self.playlist_view.tracks_model.rowCount()):
-                    track_id_data = self.playlist_view.tracks_model.data(
-                        self.playlist_view.tracks_model.index(i, 0), Qt.ItemDataRole.UserRole)
+                for i in range(current_widget.tracks_model.rowCount()):
+                    track_id_data = current_widget.tracks_model.data(
+                        current_widget.tracks_model.index(i, 0), Qt.ItemDataRole.UserRole)
                     if track_id_data is not None:
                         all_track_ids.append(track_id_data)
                     
@@ -581,8 +728,11 @@ class MainWindow(QMainWindow):
 
     def on_progress_slider_moved(self, position: int):
         """Handle progress slider movement while dragging"""
-        # Only update the time display during dragging
-        self.current_time_label.setText(format_duration_ms(position))
+        # Only update the time display during dragging, and only per whole second
+        sec = position // 1000
+        if sec != self._last_displayed_sec:
+            self._last_displayed_sec = sec
+            self.current_time_label.setText(format_duration_ms(position))
         
     def on_progress_slider_released(self):
         """Handle progress slider release (actually seek when user releases)"""
@@ -647,6 +797,7 @@ class MainWindow(QMainWindow):
         self.scanner_worker.signals.progress.connect(self.update_scan_progress)
         self.scanner_worker.signals.scan_finished.connect(self.on_scan_finished)
         self.scanner_worker.signals.error_occurred.connect(self.on_scan_error)
+        self.scanner_worker.signals.errors_occurred.connect(self.on_scan_errors)
 
         self.thread_pool.start(self.scanner_worker)
 
@@ -668,6 +819,16 @@ class MainWindow(QMainWindow):
          self.status_bar.showMessage(f"Scan Error: {message}", 5000)
          # Optionally log the error more permanently
 
+    @Slot(list)
+    def on_scan_errors(self, messages):
+        """Handles a batch of per-file errors reported by the scanner."""
+        if not messages:
+            return
+        if len(messages) == 1:
+            self.on_scan_error(messages[0])
+        else:
+            self.on_scan_error(f"{messages[-1]} (+{len(messages) - 1} more)")
+
     @Slot(int)
     def on_scan_finished(self, count):
         """Called when the scanner thread finishes."""
@@ -789,7 +950,7 @@ class MainWindow(QMainWindow):
         
         # Playlists view action
         playlists_action = QAction("&Playlists", self)
-        playlists_action.triggered.connect(lambda: self.stacked_widget.setCurrentWidget(self.playlist_view))
+        playlists_action.triggered.connect(self._show_playlists)
         view_menu.addAction(playlists_action)
         
         # Audio Menu
@@ -974,11 +1135,12 @@ class MainWindow(QMainWindow):
             tracks = get_playlist_tracks(playlist_id)
             
             # Update the playlist view with the tracks
-            if hasattr(self, 'playlist_view') and hasattr(self.playlist_view, 'set_tracks'):
-                self.playlist_view.set_tracks(tracks)
+            playlist_view = self._get_playlist_view()
+            if hasattr(playlist_view, 'set_tracks'):
+                playlist_view.set_tracks(tracks)
                 
                 # Make the playlist view visible
-                self.stacked_widget.setCurrentWidget(self.playlist_view)
+                self.stacked_widget.setCurrentWidget(playlist_view)
                 
                 # Update status
                 self.status_bar.showMessage(f"Loaded playlist with {len(tracks)} tracks", 3000)
@@ -987,16 +1149,37 @@ class MainWindow(QMainWindow):
         else:
             print("Warning: Database not initialized")
 
+    def _get_playlist_view(self):
+        """Return the playlist view, building it on first use."""
+        playlist_view = self._views.get('playlist')
+        if playlist_view is None:
+            # Imported here so startup doesn't load the module until it is needed
+            from ui.views.playlist_view import PlaylistView
+            playlist_view = PlaylistView()
+            playlist_view.playlist_selected.connect(self.load_playlist_tracks)
+            playlist_view.track_selected.connect(self.on_track_selected)
+            self.stacked_widget.addWidget(playlist_view)
+            self._views['playlist'] = playlist_view
+            self.load_playlists()
+        return playlist_view
+
+    def _show_playlists(self):
+        self.stacked_widget.setCurrentWidget(self._get_playlist_view())
+
     def load_playlists(self):
         """Load all playlists from the database."""
+        playlist_view = self._views.get('playlist')
+        if playlist_view is None:
+            return  # Not built yet; _get_playlist_view() loads them then
+        
         if hasattr(self, 'db'):
             # Get all playlists
             from core.database import get_all_playlists
             playlists = get_all_playlists()
             
             # Update the playlist view
-            if hasattr(self, 'playlist_view') and hasattr(self.playlist_view, 'set_playlists'):
-                self.playlist_view.set_playlists(playlists)
+            if hasattr(playlist_view, 'set_playlists'):
+                playlist_view.set_playlists(playlists)
                 self.status_bar.showMessage(f"Loaded {len(playlists)} playlists", 3000)
             else:
                 print("Warning: playlist_view not available or missing set_playlists method")
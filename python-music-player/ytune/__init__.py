@@ -0,0 +1 @@
+"""Launcher package so the player can be started with `python -m ytune`."""
@@ -0,0 +1,5 @@
+# ytune/__main__.py
+# ytune.app defers its Qt widget and database imports until main() runs
+from ytune.app import main
+
+main()
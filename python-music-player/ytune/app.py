@@ -0,0 +1,137 @@
+# ytune/app.py
+import os
+import re
+import sys
+from PySide6.QtWidgets import QApplication
+from PySide6.QtCore import QCoreApplication, Qt, QStandardPaths
+
+# --- Application Details ---
+APP_NAME = "PythonMusicPlayer"
+APP_VERSION = "0.1.0"
+ORG_NAME = "MyCompany" # Used for QSettings path
+ORG_DOMAIN = "mycompany.com" # Used for QSettings path
+
+# High-DPI pixmaps as before, plus coalescing of mouse-move/resize floods
+# (e.g. while dragging the seek slider)
+_APP_ATTRIBUTES = (
+    Qt.ApplicationAttribute.AA_UseHighDpiPixmaps,
+    Qt.ApplicationAttribute.AA_CompressHighFrequencyEvents,
+)
+
+# Icons at or above this size are left for Qt to load on demand
+_ICON_PRELOAD_MAX = 64 * 1024
+
+_QSS_COMMENT_RE = re.compile(r'/\*.*?\*/', re.S)
+_QSS_SPACE_RE = re.compile(r'\s+')
+
+
+def preload_icons(icons_dir):
+    """Read every small icon in icons_dir in one directory pass.
+
+    Returns a dict of basename -> file bytes for MainWindow to decode from.
+    """
+    icon_cache = {}
+    try:
+        with os.scandir(icons_dir) as it:
+            for entry in it:
+                if entry.is_file() and entry.stat().st_size < _ICON_PRELOAD_MAX:
+                    with open(entry.path, "rb") as f:
+                        icon_cache[entry.name] = f.read()
+    except OSError as e:
+        print(f"Error preloading icons: {e}")
+    return icon_cache
+
+
+def _read_text(path, size):
+    """Read a UTF-8 file of known size with a single unbuffered read."""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        return os.read(fd, size).decode("utf-8")
+    finally:
+        os.close(fd)
+
+
+def _write_atomic(path, text):
+    """Write text to path via a temp file so readers never see a partial file."""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(text)
+    os.replace(tmp_path, path)
+
+
+def load_stylesheet(style_path):
+    """Return the minified stylesheet, reusing the cached copy when it is current.
+
+    The cache lives in the Qt cache location and is keyed by the source
+    mtime and APP_VERSION, so edits or upgrades rebuild it.
+    """
+    cache_dir = QStandardPaths.writableLocation(QStandardPaths.StandardLocation.CacheLocation)
+    cached_path = os.path.join(cache_dir, "style.cached.qss")
+    key_path = cached_path + ".key"
+    st = os.stat(style_path)
+    key = f"{st.st_mtime}:{APP_VERSION}"
+
+    try:
+        with open(key_path, "r", encoding="utf-8") as f:
+            if f.read() == key:
+                return _read_text(cached_path, os.stat(cached_path).st_size)
+    except OSError:
+        pass
+
+    qss = _read_text(style_path, st.st_size)
+    qss = _QSS_SPACE_RE.sub(' ', _QSS_COMMENT_RE.sub('', qss)).strip()
+
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        # Stylesheet first: a key without a matching sheet must never exist.
+        _write_atomic(cached_path, qss)
+        _write_atomic(key_path, key)
+    except OSError as e:
+        print(f"Could not cache stylesheet: {e}")
+    return qss
+
+def main():
+    # Set app info before QApplication exists so QSettings/QStandardPaths
+    # resolve their paths once with the final values
+    QCoreApplication.setOrganizationName(ORG_NAME)
+    QCoreApplication.setOrganizationDomain(ORG_DOMAIN)
+    QCoreApplication.setApplicationName(APP_NAME)
+    QCoreApplication.setApplicationVersion(APP_VERSION)
+    
+    # High DPI policy and application attributes must be set before QApplication exists
+    QApplication.setHighDpiScaleFactorRoundingPolicy(
+        Qt.HighDpiScaleFactorRoundingPolicy.PassThrough
+    )
+    for attribute in _APP_ATTRIBUTES:
+        QApplication.setAttribute(attribute)
+    
+    # Create application
+    app = QApplication(sys.argv)
+    
+    # Imported here so widget and database modules load after QApplication exists
+    from core.database import initialize_db
+    
+    # Make sure the database is initialized
+    initialize_db()
+    
+    # assets/ sits next to the ytune package, one level above this file
+    assets_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "assets")
+    
+    # Load stylesheet
+    style_path = os.path.join(assets_dir, "style.qss")
+    try:
+        app.setStyleSheet(load_stylesheet(style_path))
+    except FileNotFoundError:
+        print(f"Style file not found at {style_path}")
+    except Exception as e:
+        print(f"Error loading stylesheet: {e}")
+    
+    icon_cache = preload_icons(os.path.join(assets_dir, "icons"))
+    
+    # Create and show main window
+    from ui.main_window import MainWindow
+    main_window = MainWindow(icon_cache=icon_cache)
+    main_window.show()
+    
+    # Run application
+    sys.exit(app.exec())